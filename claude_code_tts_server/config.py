@@ -23,6 +23,9 @@ class TTSConfig(BaseSettings):
     # Kokoro settings (local, free)
     kokoro_voice: str = Field(default="af_heart", alias="TTS_KOKORO_VOICE")
     kokoro_lang: str = Field(default="a", alias="TTS_KOKORO_LANG")
+    kokoro_compile: bool = Field(default=False, alias="TTS_KOKORO_COMPILE")
+    kokoro_precision: Literal["fp32", "bf16"] = Field(default="fp32", alias="TTS_KOKORO_PRECISION")
+    kokoro_quantize: bool = Field(default=False, alias="TTS_KOKORO_QUANTIZE")
 
     # Groq PlayAI settings (API, fast)
     groq_api_key: str | None = Field(default=None, alias="TTS_GROQ_API_KEY")
@@ -65,7 +65,7 @@ class PendingMessage:
     id: str
     request_id: str | None
     text: str
-    timestamp: float
+    timestamp: float  # time.monotonic() when queued
 
     @classmethod
     def create(cls, text: str, request_id: str | None = None) -> "PendingMessage":
@@ -74,7 +74,7 @@ class PendingMessage:
             id=str(uuid.uuid4()),
             request_id=request_id,
             text=text,
-            timestamp=time.time(),
+            timestamp=time.monotonic(),
         )
 
 
@@ -160,7 +160,7 @@ class AudioPipeline:
                     pass
 
         # Stop playback and cleanup
-        self.player.stop()
+        await self.player.stop()
         self.sounds.cleanup()
 
         # Clean up any remaining audio files
@@ -286,7 +286,7 @@ class AudioPipeline:
             True if something was skipped, False otherwise.
         """
         if self.player.is_playing():
-            audio_file = self.player.stop()
+            audio_file = await self.player.stop()
             if audio_file:
                 try:
                     os.unlink(audio_file)
@@ -373,6 +373,10 @@ class AudioPipeline:
 
                 async with self.messages_lock:
                     if self.config.queue:
+                        while len(self.pending_messages) >= self.config.max_queue:
+                            dropped = self.pending_messages.popleft()
+                            log.warning(f"Queue full, dropped message: {sanitize_for_log(dropped.text, 50)}")
+                            self._play_drop_sound()
                         self.pending_messages.append(msg)
                     else:
                         while self.pending_messages:
@@ -434,12 +438,23 @@ class AudioPipeline:
                         continue
                     self.pending_messages.popleft()
 
-                # Save audio and add to ready queue
-                audio_file = save_audio(audio, self.tts.get_sample_rate(), self.config.speed)
+                # Save audio (and time-stretch, if configured) off the event loop,
+                # then add to ready queue
+                audio_file = await asyncio.to_thread(
+                    save_audio, audio, self.tts.get_sample_rate(), self.config.speed
+                )
 
                 async with self.audio_lock:
                     ready = ReadyAudio(msg.id, msg.request_id, audio_file, msg.text)
                     if self.config.queue:
+                        while len(self.ready_audio) >= self.config.max_queue:
+                            old = self.ready_audio.popleft()
+                            log.warning(f"Queue full, dropped ready audio: {sanitize_for_log(old.text, 50)}")
+                            self._play_drop_sound()
+                            try:
+                                os.unlink(old.audio_file)
+                            except OSError:
+                                pass
                         self.ready_audio.append(ready)
                     else:
                         while self.ready_audio:
@@ -460,12 +475,8 @@ class AudioPipeline:
         log.debug("Playback worker started")
 
         while not self.shutdown_event.is_set():
-            # Check for ready audio
-            try:
-                await asyncio.wait_for(self.audio_ready_event.wait(), timeout=0.1)
-                self.audio_ready_event.clear()
-            except asyncio.TimeoutError:
-                pass
+            # Wait for ready audio or for current playback to finish
+            await self._wait_for_playback_event(timeout=0.5)
 
             # Check if current audio finished
             finished_file = self.player.check_finished()
@@ -490,12 +501,15 @@ class AudioPipeline:
 
                 elapsed = self.player.get_elapsed_time()
                 if elapsed is not None and elapsed < self.config.min_duration:
-                    await asyncio.sleep(0.05)
+                    # Revisit once the minimum duration has passed, or sooner
+                    # if the current audio finishes on its own
+                    await self._wait_for_playback_event(timeout=self.config.min_duration - elapsed)
+                    self.audio_ready_event.set()
                     continue
 
                 # Interrupt current audio
                 log.debug("Interrupting current audio")
-                audio_file = self.player.stop()
+                audio_file = await self.player.stop()
                 self._current_text = None
                 if audio_file:
                     try:
@@ -518,18 +532,31 @@ class AudioPipeline:
 
             log.info(f"Playing: {sanitize_for_log(next_audio.text)}")
 
-            if self.player.play(next_audio.audio_file):
+            if await self.player.play(next_audio.audio_file):
                 self._current_text = next_audio.text
                 log.debug("Audio start")
 
         # Cleanup on shutdown
-        audio_file = self.player.stop()
+        audio_file = await self.player.stop()
         if audio_file:
             try:
                 os.unlink(audio_file)
             except OSError:
                 pass
 
+    async def _wait_for_playback_event(self, timeout: float) -> None:
+        """Wait until audio is ready, playback finishes, or the timeout expires."""
+        waiters = [
+            asyncio.create_task(self.audio_ready_event.wait()),
+            asyncio.create_task(self.player.finished_event.wait()),
+        ]
+        try:
+            await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+        self.audio_ready_event.clear()
+
 
 # Backwards compatibility alias
 AudioManager = AudioPipeline
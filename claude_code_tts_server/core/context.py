@@ -1,9 +1,15 @@
 """Request context and logging utilities."""
 
-import uuid
+import secrets
+from collections.abc import Iterator
+from contextlib import contextmanager
 from contextvars import ContextVar
 
 
+# Translation table for sanitize_for_log: escape newlines, drop carriage returns
+_LOG_TRANSLATION = str.maketrans({"\n": "\\n", "\r": ""})
+
+
 def sanitize_for_log(text: str, max_len: int = 80) -> str:
     """Sanitize text for logging: replace newlines, truncate.
 
@@ -14,7 +20,9 @@ def sanitize_for_log(text: str, max_len: int = 80) -> str:
     Returns:
         Sanitized text safe for single-line logging.
     """
-    text = text.replace("\n", "\\n").replace("\r", "")
+    if len(text) <= max_len and "\n" not in text and "\r" not in text:
+        return text
+    text = text.translate(_LOG_TRANSLATION)
     if len(text) > max_len:
         return text[:max_len] + "..."
     return text
@@ -31,11 +39,27 @@ def get_request_id() -> str | None:
 def set_request_id(request_id: str | None = None) -> str:
     """Set or generate a new request ID."""
     if request_id is None:
-        request_id = uuid.uuid4().hex[:8]
+        request_id = secrets.token_hex(4)
     request_id_var.set(request_id)
     return request_id
 
 
-def clear_request_id() -> None:
-    """Clear the request ID."""
-    request_id_var.set(None)
+@contextmanager
+def request_id_scope(request_id: str | None = None) -> Iterator[str]:
+    """Set or generate a request ID for the duration of a block.
+
+    The previous value is restored on exit, so scopes can nest.
+
+    Args:
+        request_id: Request ID to use, or None to generate one.
+
+    Yields:
+        The request ID in effect inside the block.
+    """
+    if request_id is None:
+        request_id = secrets.token_hex(4)
+    token = request_id_var.set(request_id)
+    try:
+        yield request_id
+    finally:
+        request_id_var.reset(token)
@@ -13,6 +13,22 @@ def _trace(self, message, *args, **kwargs):
         self._log(TRACE, message, args, **kwargs)
 
 
+def _trace_disabled(self, message, *args, **kwargs):
+    """Discard TRACE messages without checking the logger level."""
+
+
+def set_trace_enabled(enabled: bool) -> None:
+    """Install the real or no-op Logger.trace method.
+
+    Called once the log level is known, so trace calls cost a single no-op
+    call when TRACE logging is off. This applies to every logger.
+
+    Args:
+        enabled: Whether TRACE messages may be emitted.
+    """
+    logging.Logger.trace = _trace if enabled else _trace_disabled
+
+
 # Add trace method to Logger class
 logging.Logger.trace = _trace
 
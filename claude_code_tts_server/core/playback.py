@@ -1,17 +1,27 @@
 """Audio playback utilities."""
 
 import asyncio
+import functools
 import logging
-import subprocess
+import os
+import shutil
 import sys
+import time
 from pathlib import Path
 
 log = logging.getLogger("tts-server")
 
+# Shared /dev/null descriptor for player output, opened once instead of per spawn
+_DEVNULL_FD = os.open(os.devnull, os.O_RDWR)
 
+
+@functools.lru_cache(maxsize=1)
 def get_player(volume: float = 1.0) -> list[str] | None:
     """Get audio player command for this platform.
 
+    The result is cached, so the PATH lookup only happens once per volume.
+    Callers must not mutate the returned list.
+
     Args:
         volume: Volume multiplier (1.0 = normal, 2.0 = double).
 
@@ -25,37 +35,49 @@ def get_player(volume: float = 1.0) -> list[str] | None:
         return cmd
 
     for player in [["mpv", "--no-terminal"], ["paplay"], ["aplay"]]:
-        try:
-            result = subprocess.run(
-                ["which", player[0]], capture_output=True, check=False
-            )
-            if result.returncode == 0:
-                if volume != 1.0 and player[0] == "mpv":
-                    player += [f"--volume={int(volume * 100)}"]
-                return player
-        except OSError:
-            pass
+        if shutil.which(player[0]) is not None:
+            if volume != 1.0 and player[0] == "mpv":
+                player += [f"--volume={int(volume * 100)}"]
+            return player
     return None
 
 
-def play_sound_async(audio_file: Path | str, volume: float = 1.0) -> subprocess.Popen | None:
-    """Play sound without blocking (fire-and-forget).
+async def _spawn_player(
+    audio_file: Path | str | None, volume: float = 1.0
+) -> asyncio.subprocess.Process | None:
+    """Start the platform audio player on a file.
 
     Args:
         audio_file: Path to the audio file to play.
         volume: Volume multiplier (1.0 = normal, 2.0 = double).
 
     Returns:
-        The subprocess, or None if playback failed.
+        The player process, or None if no player or file is available.
     """
     player = get_player(volume)
-    if player and audio_file:
-        return subprocess.Popen(
-            player + [str(audio_file)],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
-    return None
+    if not (player and audio_file):
+        return None
+    return await asyncio.create_subprocess_exec(
+        *player,
+        str(audio_file),
+        stdout=_DEVNULL_FD,
+        stderr=_DEVNULL_FD,
+    )
+
+
+async def play_sound_async(
+    audio_file: Path | str, volume: float = 1.0
+) -> asyncio.subprocess.Process | None:
+    """Play sound without waiting for it to finish.
+
+    Args:
+        audio_file: Path to the audio file to play.
+        volume: Volume multiplier (1.0 = normal, 2.0 = double).
+
+    Returns:
+        The subprocess, or None if playback failed.
+    """
+    return await _spawn_player(audio_file, volume)
 
 
 class AudioPlayer:
@@ -63,22 +85,29 @@ class AudioPlayer:
 
     def __init__(self, volume: float = 1.0):
         self.volume = volume
-        self.current_process: subprocess.Popen | None = None
+        self.current_process: asyncio.subprocess.Process | None = None
         self.play_start_time: float | None = None
         self._current_audio_file: Path | None = None
+        # Set when the current player process exits on its own
+        self.finished_event = asyncio.Event()
+        self._finish_task: asyncio.Task | None = None
+        self._background_tasks: set[asyncio.Task] = set()
+
+        # Resolve the player once at startup (later lookups hit the cache)
+        if get_player(volume) is None:
+            log.warning("No audio player found (install mpv, paplay or aplay)")
 
     def is_playing(self) -> bool:
         """Check if audio is currently playing."""
-        return self.current_process is not None and self.current_process.poll() is None
+        return self.current_process is not None and not self.finished_event.is_set()
 
     def get_elapsed_time(self) -> float | None:
         """Get time elapsed since playback started."""
         if self.play_start_time is None:
             return None
-        import time
         return time.monotonic() - self.play_start_time
 
-    def play(self, audio_file: Path) -> bool:
+    async def play(self, audio_file: Path) -> bool:
         """Start playing an audio file.
 
         Args:
@@ -87,53 +116,67 @@ class AudioPlayer:
         Returns:
             True if playback started, False otherwise.
         """
-        import time
-
-        player = get_player(self.volume)
-        if not player:
+        proc = await _spawn_player(audio_file, self.volume)
+        if not proc:
             return False
 
-        self.current_process = subprocess.Popen(
-            player + [str(audio_file)],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
+        self.finished_event.clear()
+        self.current_process = proc
         self.play_start_time = time.monotonic()
         self._current_audio_file = audio_file
+        self._finish_task = asyncio.create_task(self._on_finish(self.current_process))
         return True
 
-    def stop(self) -> Path | None:
+    async def _on_finish(self, proc: asyncio.subprocess.Process) -> None:
+        """Signal finished_event once the player process exits."""
+        await proc.wait()
+        # Ignore processes that were stopped or replaced in the meantime
+        if proc is self.current_process:
+            self.finished_event.set()
+
+    async def stop(self) -> Path | None:
         """Stop currently playing audio.
 
         Returns:
             Path to the audio file that was playing, for cleanup.
         """
         audio_file = self._current_audio_file
-
-        if self.current_process and self.current_process.poll() is None:
-            self.current_process.terminate()
-            try:
-                self.current_process.wait(timeout=0.1)
-            except subprocess.TimeoutExpired:
-                self.current_process.kill()
+        proc = self.current_process
 
         self.current_process = None
         self.play_start_time = None
         self._current_audio_file = None
+        self._finish_task = None
+        self.finished_event.clear()
+
+        if proc and proc.returncode is None:
+            try:
+                proc.terminate()
+            except ProcessLookupError:
+                pass
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=0.1)
+            except asyncio.TimeoutError:
+                proc.kill()
 
         return audio_file
 
     def check_finished(self) -> Path | None:
         """Check if playback finished and return the file for cleanup.
 
+        Callers that want to block until playback ends should await
+        ``finished_event.wait()`` instead of polling this method.
+
         Returns:
             Path to the finished audio file if playback ended, None otherwise.
         """
-        if self.current_process and self.current_process.poll() is not None:
+        if self.finished_event.is_set():
             audio_file = self._current_audio_file
             self.current_process = None
             self.play_start_time = None
             self._current_audio_file = None
+            self._finish_task = None
+            self.finished_event.clear()
             return audio_file
         return None
 
@@ -147,27 +190,19 @@ class AudioPlayer:
         if not chime_file:
             return
 
-        player = get_player(self.volume)
-        if not player:
-            return
-
         log.debug("Playing chime")
-        proc = subprocess.Popen(
-            player + [str(chime_file)],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
+        proc = await _spawn_player(chime_file, self.volume)
+        if not proc:
+            return
 
         # Wait briefly for chime (but not forever)
-        elapsed = 0.0
-        while elapsed < max_wait:
-            if proc.poll() is not None:
-                break
-            await asyncio.sleep(0.05)
-            elapsed += 0.05
-
-        if proc.poll() is None:
-            proc.terminate()
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=max_wait)
+        except asyncio.TimeoutError:
+            try:
+                proc.terminate()
+            except ProcessLookupError:
+                pass
 
     def play_drop_sound(self, drop_file: Path | None) -> None:
         """Play drop tone (fire-and-forget).
@@ -177,4 +212,7 @@ class AudioPlayer:
         """
         if drop_file:
             log.debug("Playing drop tone")
-            play_sound_async(drop_file, self.volume)
+            task = asyncio.create_task(play_sound_async(drop_file, self.volume))
+            # Keep a reference so the task isn't garbage collected mid-spawn
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
@@ -1,6 +1,10 @@
 """Sound effect generation for chimes and drop tones."""
 
+import atexit
+import importlib.resources
 import os
+import shutil
+import subprocess
 import tempfile
 import time
 from pathlib import Path
@@ -12,6 +16,10 @@ from .logging import get_logger
 
 log = get_logger()
 
+# Sample rate of the pre-rendered WAVs in claude_code_tts_server/data
+# (regenerate with scripts/gen_sounds.py)
+SOUND_DATA_SAMPLE_RATE = 24000
+
 
 def generate_chime(sample_rate: int = 24000) -> np.ndarray:
     """Generate two-note chime (G5 -> C6) for interrupts.
@@ -19,29 +27,41 @@ def generate_chime(sample_rate: int = 24000) -> np.ndarray:
     Returns:
         Audio as float32 numpy array.
     """
-    def make_note(freq: float, duration: float, amplitude: float = 0.25) -> np.ndarray:
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        # Fundamental + harmonics
-        note = amplitude * np.sin(2 * np.pi * freq * t)
-        note += amplitude * 0.3 * np.sin(2 * np.pi * freq * 2 * t)
-        note += amplitude * 0.1 * np.sin(2 * np.pi * freq * 3 * t)
-        # Envelope with attack and decay
-        envelope = np.exp(-t * 8)
+    # Fundamental + harmonics, summed with a single matmul
+    harmonics = np.array([1, 2, 3], dtype=np.float32)[:, None]
+    harmonic_amps = np.array([1, 0.3, 0.1], dtype=np.float32)
+
+    note_samples = int(sample_rate * 0.08)
+    gap_samples = int(sample_rate * 0.03)
+    chime = np.zeros(2 * note_samples + gap_samples, dtype=np.float32)
+
+    def make_note(out: np.ndarray, freq: float, amplitude: float = 0.25) -> None:
+        """Synthesize one note directly into the output slice.
+
+        Uses in-place ufuncs so only the time axis and the harmonic phases
+        are allocated.
+        """
+        t = np.arange(len(out), dtype=np.float32)
+        t /= np.float32(sample_rate)
+        phases = np.multiply(np.float32(2 * np.pi * freq) * harmonics, t)
+        np.sin(phases, out=phases)
+        np.matmul(harmonic_amps * np.float32(amplitude), phases, out=out)
+        # Envelope with attack and decay, computed in the time buffer
+        envelope = np.exp(np.multiply(t, -8, out=t), out=t)
         attack = int(len(t) * 0.05)
-        envelope[:attack] *= np.linspace(0, 1, attack)
-        return note * envelope
+        envelope[:attack] *= np.linspace(0, 1, attack, dtype=np.float32)
+        out *= envelope
 
-    note1 = make_note(784, 0.08)  # G5
-    note2 = make_note(1047, 0.08)  # C6
-    gap = np.zeros(int(sample_rate * 0.03))
-    chime = np.concatenate([note1, gap, note2])
+    # Notes are written in place; the gap between them stays zero
+    make_note(chime[:note_samples], 784)  # G5
+    make_note(chime[note_samples + gap_samples:], 1047)  # C6
 
     # Fade out
     fade = int(sample_rate * 0.02)
     if fade > 0:
-        chime[-fade:] *= np.linspace(1, 0, fade)
+        chime[-fade:] *= np.linspace(1, 0, fade, dtype=np.float32)
 
-    return chime.astype(np.float32)
+    return chime
 
 
 def generate_drop_tone(sample_rate: int = 24000) -> np.ndarray:
@@ -51,30 +71,31 @@ def generate_drop_tone(sample_rate: int = 24000) -> np.ndarray:
         Audio as float32 numpy array.
     """
     duration = 0.15
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
+    t = np.linspace(0, duration, int(sample_rate * duration), False, dtype=np.float32)
 
     # Base frequency - E5, gentle and musical
     freq = 659
 
     # Fundamental with decaying harmonics (kalimba/music box character)
-    tone = np.sin(2 * np.pi * freq * t)
-    tone += 0.5 * np.sin(2 * np.pi * freq * 2 * t) * np.exp(-t * 20)
-    tone += 0.25 * np.sin(2 * np.pi * freq * 3 * t) * np.exp(-t * 30)
-    tone += 0.1 * np.sin(2 * np.pi * freq * 4 * t) * np.exp(-t * 40)
+    harmonics = np.array([1, 2, 3, 4], dtype=np.float32)[:, None]
+    harmonic_amps = np.array([1, 0.5, 0.25, 0.1], dtype=np.float32)[:, None]
+    harmonic_decay = np.array([0, 20, 30, 40], dtype=np.float32)[:, None]
+    weights = harmonic_amps * np.exp(-harmonic_decay * t)
+    tone = np.einsum("kn,kn->n", weights, np.sin(2 * np.pi * freq * harmonics * t))
 
     # Pluck envelope - quick attack, smooth decay
     attack_time = 0.005
     attack_samples = int(sample_rate * attack_time)
     envelope = np.exp(-t * 10)
-    envelope[:attack_samples] = np.linspace(0, 1, attack_samples)
+    envelope[:attack_samples] = np.linspace(0, 1, attack_samples, dtype=np.float32)
 
-    pluck = tone * envelope * 0.18
+    pluck = tone * envelope * np.float32(0.18)
 
     # Soft fade out
     fade = int(sample_rate * 0.03)
-    pluck[-fade:] *= np.linspace(1, 0, fade)
+    pluck[-fade:] *= np.linspace(1, 0, fade, dtype=np.float32)
 
-    return pluck.astype(np.float32)
+    return pluck
 
 
 def _check_rubberband_available() -> None:
@@ -83,9 +104,6 @@ def _check_rubberband_available() -> None:
     Raises:
         ImportError: If rubberband is not installed or not functional.
     """
-    import shutil
-    import subprocess
-
     # Check for pyrubberband Python package
     try:
         import pyrubberband  # noqa: F401
@@ -143,13 +161,16 @@ def time_stretch(audio: np.ndarray, sample_rate: int, speed: float) -> np.ndarra
     start = time.perf_counter()
     result = pyrb.time_stretch(audio, sample_rate, speed).astype(audio.dtype)
     elapsed = time.perf_counter() - start
-    log.trace(f"Rubberband time stretch ({speed}x): {elapsed:.3f}s")
+    log.trace("Rubberband time stretch (%sx): %.3fs", speed, elapsed)
     return result
 
 
 def save_audio(audio: np.ndarray, sample_rate: int = 24000, speed: float = 1.0) -> Path:
     """Save audio to a temporary WAV file.
 
+    Samples are stored as 32-bit float, so the float32 audio is written
+    without conversion to 16-bit PCM.
+
     Args:
         audio: Audio data as numpy array.
         sample_rate: Sample rate in Hz.
@@ -168,12 +189,17 @@ def save_audio(audio: np.ndarray, sample_rate: int = 24000, speed: float = 1.0)
     start = time.perf_counter()
     with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
         path = Path(f.name)
-    sf.write(path, audio, sample_rate)
+    sf.write(path, audio, sample_rate, subtype="FLOAT")
     elapsed = time.perf_counter() - start
-    log.trace(f"Audio file save: {elapsed:.3f}s")
+    log.trace("Audio file save: %.3fs", elapsed)
     return path
 
 
+def _packaged_sound(name: str) -> Path:
+    """Get the path of a pre-rendered sound shipped with the package."""
+    return Path(str(importlib.resources.files("claude_code_tts_server") / "data" / name))
+
+
 class SoundManager:
     """Manages sound effect files."""
 
@@ -181,19 +207,35 @@ class SoundManager:
         self.sample_rate = sample_rate
         self.chime_file: Path | None = None
         self.drop_file: Path | None = None
+        self._generated = False
 
     def init_sounds(self) -> None:
-        """Generate and save sound effect files."""
-        self.chime_file = save_audio(generate_chime(self.sample_rate), self.sample_rate)
-        self.drop_file = save_audio(generate_drop_tone(self.sample_rate), self.sample_rate)
+        """Locate or generate sound effect files.
+
+        Uses the WAVs shipped with the package when the sample rate matches,
+        otherwise synthesizes them into temporary files.
+        """
+        if self.sample_rate == SOUND_DATA_SAMPLE_RATE:
+            self.chime_file = _packaged_sound("chime_24k.wav")
+            self.drop_file = _packaged_sound("drop_24k.wav")
+            self._generated = False
+        else:
+            self.chime_file = save_audio(generate_chime(self.sample_rate), self.sample_rate)
+            self.drop_file = save_audio(generate_drop_tone(self.sample_rate), self.sample_rate)
+            self._generated = True
+            # Remove the temp files even if the server exits without cleanup()
+            atexit.register(self.cleanup)
 
     def cleanup(self) -> None:
-        """Delete sound effect files."""
-        for f in [self.chime_file, self.drop_file]:
-            if f and f.exists():
-                try:
-                    os.unlink(f)
-                except OSError:
-                    pass
+        """Delete generated sound effect files (packaged files are kept)."""
+        if self._generated:
+            atexit.unregister(self.cleanup)
+            for f in [self.chime_file, self.drop_file]:
+                if f and f.exists():
+                    try:
+                        os.unlink(f)
+                    except OSError:
+                        pass
         self.chime_file = None
         self.drop_file = None
+        self._generated = False
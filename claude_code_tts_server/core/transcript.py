@@ -2,7 +2,11 @@
 
 import json
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass
+from typing import IO
+
+import orjson
 
 # Default max content length (~5k tokens worth)
 DEFAULT_MAX_CONTENT_LENGTH = 20000
@@ -18,8 +22,26 @@ class ParsedTranscript:
     truncated: bool = False
 
 
+def _parse_jsonl(lines: Iterable[str | bytes]) -> list[dict]:
+    """Parse JSONL lines, skipping blank and invalid lines."""
+    entries = []
+    for line in lines:
+        line = line.strip()
+        if line:
+            try:
+                entries.append(orjson.loads(line))
+            except orjson.JSONDecodeError:
+                # orjson is stricter than json: it rejects lone surrogates (e.g. an
+                # emoji cut in half in tool output) and NaN/Infinity
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+    return entries
+
+
 def parse_transcript(
-    content: str,
+    content: str | IO[str] | IO[bytes] | Iterable[dict],
     max_content_length: int = DEFAULT_MAX_CONTENT_LENGTH,
 ) -> ParsedTranscript | None:
     """Parse Claude Code transcript JSONL content.
@@ -28,24 +50,23 @@ def parse_transcript(
     This mirrors the jq logic from the shell scripts.
 
     Args:
-        content: JSONL content string (newline-separated JSON objects).
+        content: JSONL content string (newline-separated JSON objects), an
+            open text or binary JSONL file (read line by line), or
+            already-parsed transcript entries.
         max_content_length: Maximum content length before truncation (default 20000).
 
     Returns:
         ParsedTranscript with content and metadata, or None if no content.
     """
-    if not content or not content.strip():
+    if not content:
         return None
 
-    # Parse JSONL content
-    entries = []
-    for line in content.splitlines():
-        line = line.strip()
-        if line:
-            try:
-                entries.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
+    if isinstance(content, str):
+        entries = _parse_jsonl(content.splitlines())
+    elif hasattr(content, "read"):
+        entries = _parse_jsonl(content)
+    else:
+        entries = list(content)
 
     if not entries:
         return None
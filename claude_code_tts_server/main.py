@@ -12,9 +12,10 @@ from fastapi import FastAPI, Request
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from .api.routes import router
-from .core.context import clear_request_id, set_request_id
+from .core.context import get_request_id, request_id_scope
 from .config import AudioConfig, ServerConfig, SummarizerConfig, TTSConfig
 from .core.audio_manager import AudioManager
+from .core.sounds import _check_rubberband_available
 from .summarizers.base import SummarizerInterface
 from .summarizers.groq import GroqSummarizer
 from .summarizers.ollama import OllamaSummarizer
@@ -46,19 +47,15 @@ warnings.filterwarnings("ignore", category=UserWarning)
 warnings.filterwarnings("ignore", category=FutureWarning)
 
 # Import TRACE level (this also adds .trace() method to Logger)
-from .core.logging import TRACE
+from .core.logging import TRACE, set_trace_enabled
 
 
 class RequestIDMiddleware(BaseHTTPMiddleware):
     """Middleware to set request ID for each request."""
 
     async def dispatch(self, request: Request, call_next):
-        request_id = set_request_id()
-        try:
-            response = await call_next(request)
-            return response
-        finally:
-            clear_request_id()
+        with request_id_scope():
+            return await call_next(request)
 
 
 class ColorFormatter(logging.Formatter):
@@ -75,8 +72,6 @@ class ColorFormatter(logging.Formatter):
     DIM = "\033[2m"
 
     def format(self, record):
-        from .core.context import get_request_id
-
         color = self.COLORS.get(record.levelno, "")
         record.levelname = f"{color}{record.levelname:<5}{self.RESET}"
 
@@ -96,6 +91,7 @@ def setup_logging(level: str = "INFO") -> logging.Logger:
     # Handle TRACE level specially since it's not in logging module
     log_level = TRACE if level.upper() == "TRACE" else getattr(logging, level.upper(), logging.INFO)
     logger.setLevel(log_level)
+    set_trace_enabled(log_level <= TRACE)
 
     # Clear existing handlers
     logger.handlers.clear()
@@ -127,7 +123,6 @@ def create_app(config: ServerConfig) -> FastAPI:
 
         # Check rubberband availability if speed is configured
         if config.audio.speed != 1.0:
-            from .core.sounds import _check_rubberband_available
             _check_rubberband_available()
 
         # Initialize TTS backend
@@ -180,7 +175,12 @@ def _log_startup_config(config: ServerConfig) -> None:
     # TTS config
     tts = config.tts
     if tts.backend == "kokoro":
-        log.info(f"TTS: {tts.backend} (voice={tts.kokoro_voice}, lang={tts.kokoro_lang})")
+        quantize_str = ", int8" if tts.kokoro_quantize else ""
+        compile_str = ", compile" if tts.kokoro_compile else ""
+        log.info(
+            f"TTS: {tts.backend} (voice={tts.kokoro_voice}, lang={tts.kokoro_lang}, "
+            f"precision={tts.kokoro_precision}{quantize_str}{compile_str})"
+        )
     elif tts.backend == "groq":
         log.info(f"TTS: {tts.backend} (voice={tts.groq_voice}, model={tts.groq_model})")
     elif tts.backend == "elevenlabs":
@@ -215,6 +215,22 @@ def _log_startup_config(config: ServerConfig) -> None:
 )
 @click.option("--kokoro-voice", default=None, help="Kokoro voice (env: TTS_KOKORO_VOICE)")
 @click.option("--kokoro-lang", default=None, help="Kokoro language code (env: TTS_KOKORO_LANG)")
+@click.option(
+    "--kokoro-compile/--no-kokoro-compile",
+    default=None,
+    help="Compile the Kokoro model with torch.compile (env: TTS_KOKORO_COMPILE)",
+)
+@click.option(
+    "--kokoro-precision",
+    type=click.Choice(["fp32", "bf16"]),
+    default=None,
+    help="Kokoro inference precision (env: TTS_KOKORO_PRECISION)",
+)
+@click.option(
+    "--kokoro-quantize/--no-kokoro-quantize",
+    default=None,
+    help="Quantize the Kokoro model to int8 for CPU inference (env: TTS_KOKORO_QUANTIZE)",
+)
 @click.option("--tts-groq-voice", default=None, help="Groq PlayAI voice (env: TTS_GROQ_VOICE)")
 @click.option("--tts-groq-model", default=None, help="Groq TTS model (env: TTS_GROQ_MODEL)")
 @click.option("--elevenlabs-voice", default=None, help="ElevenLabs voice (env: TTS_ELEVENLABS_VOICE)")
@@ -285,6 +301,9 @@ def main(
     tts: str | None,
     kokoro_voice: str | None,
     kokoro_lang: str | None,
+    kokoro_compile: bool | None,
+    kokoro_precision: str | None,
+    kokoro_quantize: bool | None,
     tts_groq_voice: str | None,
     tts_groq_model: str | None,
     elevenlabs_voice: str | None,
@@ -316,6 +335,9 @@ def main(
             "backend": tts,
             "kokoro_voice": kokoro_voice,
             "kokoro_lang": kokoro_lang,
+            "kokoro_compile": kokoro_compile,
+            "kokoro_precision": kokoro_precision,
+            "kokoro_quantize": kokoro_quantize,
             "groq_voice": tts_groq_voice,
             "groq_model": tts_groq_model,
             "elevenlabs_voice": elevenlabs_voice,
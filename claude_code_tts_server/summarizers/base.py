@@ -1,9 +1,13 @@
 """Abstract base class for summarization backends."""
 
+import asyncio
+import urllib.request
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum, auto
 
+import httpx
+
 
 class SummaryType(Enum):
     """Type of content being summarized."""
@@ -31,6 +35,114 @@ class SummaryResult:
     tokens_used: int | None = None
 
 
+# Status codes worth retrying (rate limited / temporarily unavailable)
+RETRY_STATUS_CODES = (429, 503)
+MAX_ATTEMPTS = 3
+
+
+def _env_proxy_mounts(**transport_kwargs) -> dict[str, httpx.AsyncHTTPTransport | None]:
+    """Build transport mounts for the HTTP(S)_PROXY / ALL_PROXY / NO_PROXY settings.
+
+    httpx ignores the environment once a transport is passed explicitly, so
+    proxied schemes get their own transport with the same settings, and
+    NO_PROXY hosts map to None to fall back to the direct transport.
+
+    Args:
+        **transport_kwargs: Arguments for each proxy's AsyncHTTPTransport.
+
+    Returns:
+        Mounts for httpx.AsyncClient (empty when no proxy applies).
+    """
+    proxies = urllib.request.getproxies()
+    no_proxy = [host.strip() for host in proxies.get("no", "").split(",") if host.strip()]
+    if "*" in no_proxy:
+        return {}
+
+    mounts: dict[str, httpx.AsyncHTTPTransport | None] = {}
+    for scheme in ("http", "https", "all"):
+        if proxy := proxies.get(scheme):
+            proxy = proxy if "://" in proxy else f"http://{proxy}"
+            mounts[f"{scheme}://"] = httpx.AsyncHTTPTransport(proxy=proxy, **transport_kwargs)
+    if not mounts:
+        return mounts
+
+    for host in no_proxy:
+        if "://" in host:
+            mounts[host] = None
+        elif host.count(":") > 1:  # IPv6 address
+            mounts[f"all://[{host}]"] = None
+        else:
+            # "example.com" also covers subdomains, ".example.com" only subdomains
+            mounts[f"all://*{host}"] = None
+    return mounts
+
+
+def create_http_client(timeout: float) -> httpx.AsyncClient:
+    """Create a pooled HTTP/2 client for summarizer backends.
+
+    Keep-alive connections are reused across requests so only the first
+    summarization pays for the TCP/TLS handshake. Failed connection
+    attempts are retried at the transport level. Proxies from the
+    environment are honored.
+
+    Args:
+        timeout: Default request timeout in seconds.
+
+    Returns:
+        A configured httpx.AsyncClient.
+    """
+    transport_kwargs = {
+        "http2": True,
+        "retries": 2,
+        "limits": httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60),
+    }
+    return httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(**transport_kwargs),
+        mounts=_env_proxy_mounts(**transport_kwargs),
+        timeout=timeout,
+    )
+
+
+async def post_with_retry(client: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
+    """POST a request, retrying with exponential backoff on 429/503.
+
+    Args:
+        client: HTTP client to send the request with.
+        url: Request URL.
+        **kwargs: Additional arguments for client.post().
+
+    Returns:
+        The successful response.
+
+    Raises:
+        httpx.HTTPStatusError: If the final attempt fails.
+    """
+    for attempt in range(MAX_ATTEMPTS - 1):
+        response = await client.post(url, **kwargs)
+        if response.status_code not in RETRY_STATUS_CODES:
+            break
+        await asyncio.sleep(0.2 * 2**attempt)
+    else:
+        response = await client.post(url, **kwargs)
+
+    response.raise_for_status()
+    return response
+
+
+def extract_openai_response(data: dict) -> tuple[str, int | None]:
+    """Extract text and token usage from an OpenAI-compatible chat completion.
+
+    Args:
+        data: Decoded chat completion response body.
+
+    Returns:
+        Tuple of (text, total_tokens), where total_tokens may be None.
+    """
+    text = data["choices"][0]["message"]["content"]
+    tokens_used = (data.get("usage") or {}).get("total_tokens")
+    return text, tokens_used
+
+
 class SummarizerInterface(ABC):
     """Abstract base class for summarization backends."""
 
@@ -3,9 +3,18 @@
 import logging
 
 import httpx
+import orjson
 
 from ..config import SummarizerConfig
-from .base import SummarizerInterface, SummaryRequest, SummaryResult, SummaryType
+from .base import (
+    SummarizerInterface,
+    SummaryRequest,
+    SummaryResult,
+    SummaryType,
+    create_http_client,
+    extract_openai_response,
+    post_with_retry,
+)
 from .prompts import get_prompt_and_params
 
 log = logging.getLogger("tts-server")
@@ -16,9 +25,11 @@ class GroqSummarizer(SummarizerInterface):
 
     BASE_URL = "https://api.groq.com/openai/v1/chat/completions"
 
-    def __init__(self, config: SummarizerConfig):
+    def __init__(self, config: SummarizerConfig, client: httpx.AsyncClient | None = None):
         self.config = config
-        self.client = httpx.AsyncClient(timeout=10.0)
+        # Summary types that use a model other than the small default
+        self._model_map = {SummaryType.LONG_RESPONSE: config.groq_model_large}
+        self.client = client or create_http_client(timeout=10.0)
 
     async def summarize(self, request: SummaryRequest) -> SummaryResult:
         """Summarize content using Groq API.
@@ -39,7 +50,8 @@ class GroqSummarizer(SummarizerInterface):
         prompt, temperature, max_tokens = get_prompt_and_params(request.summary_type)
         model = self._get_model(request.summary_type)
 
-        response = await self.client.post(
+        response = await post_with_retry(
+            self.client,
             self.BASE_URL,
             headers={"Authorization": f"Bearer {self.config.groq_api_key}"},
             json={
@@ -52,15 +64,13 @@ class GroqSummarizer(SummarizerInterface):
                 "max_tokens": max_tokens,
             },
         )
-        response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
         # Check for API error in response
         if "error" in data:
             raise ValueError(f"Groq API error: {data['error'].get('message', 'Unknown error')}")
 
-        text = data["choices"][0]["message"]["content"]
-        tokens_used = data.get("usage", {}).get("total_tokens")
+        text, tokens_used = extract_openai_response(data)
 
         return SummaryResult(
             text=text,
@@ -97,10 +107,7 @@ class GroqSummarizer(SummarizerInterface):
         Returns:
             The model name to use.
         """
-        if summary_type == SummaryType.LONG_RESPONSE:
-            return self.config.groq_model_large
-        else:
-            return self.config.groq_model_small
+        return self._model_map.get(summary_type, self.config.groq_model_small)
 
     async def close(self) -> None:
         """Close the HTTP client."""
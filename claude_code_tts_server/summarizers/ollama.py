@@ -3,9 +3,18 @@
 import logging
 
 import httpx
+import orjson
 
 from ..config import SummarizerConfig
-from .base import SummarizerInterface, SummaryRequest, SummaryResult, SummaryType
+from .base import (
+    SummarizerInterface,
+    SummaryRequest,
+    SummaryResult,
+    SummaryType,
+    create_http_client,
+    extract_openai_response,
+    post_with_retry,
+)
 from .prompts import get_prompt_and_params
 
 log = logging.getLogger("tts-server")
@@ -14,11 +23,13 @@ log = logging.getLogger("tts-server")
 class OllamaSummarizer(SummarizerInterface):
     """Ollama-based summarization backend for local LLM inference."""
 
-    def __init__(self, config: SummarizerConfig):
+    def __init__(self, config: SummarizerConfig, client: httpx.AsyncClient | None = None):
         self.config = config
+        # Summary types that use a model other than the small default
+        self._model_map = {SummaryType.LONG_RESPONSE: config.ollama_model_large}
         self.base_url = config.ollama_url.rstrip("/")
         # Longer timeout for local inference which can be slower
-        self.client = httpx.AsyncClient(timeout=60.0)
+        self.client = client or create_http_client(timeout=60.0)
 
     async def summarize(self, request: SummaryRequest) -> SummaryResult:
         """Summarize content using Ollama API.
@@ -36,7 +47,8 @@ class OllamaSummarizer(SummarizerInterface):
         model = self._get_model(request.summary_type)
 
         # Use Ollama's OpenAI-compatible endpoint
-        response = await self.client.post(
+        response = await post_with_retry(
+            self.client,
             f"{self.base_url}/v1/chat/completions",
             json={
                 "model": model,
@@ -49,15 +61,13 @@ class OllamaSummarizer(SummarizerInterface):
                 "stream": False,
             },
         )
-        response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
         # Check for error in response
         if "error" in data:
             raise ValueError(f"Ollama API error: {data['error'].get('message', 'Unknown error')}")
 
-        text = data["choices"][0]["message"]["content"]
-        tokens_used = data.get("usage", {}).get("total_tokens")
+        text, tokens_used = extract_openai_response(data)
 
         return SummaryResult(
             text=text,
@@ -90,10 +100,7 @@ class OllamaSummarizer(SummarizerInterface):
         Returns:
             The model name to use.
         """
-        if summary_type == SummaryType.LONG_RESPONSE:
-            return self.config.ollama_model_large
-        else:
-            return self.config.ollama_model_small
+        return self._model_map.get(summary_type, self.config.ollama_model_small)
 
     async def close(self) -> None:
         """Close the HTTP client."""
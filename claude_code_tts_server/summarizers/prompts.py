@@ -1,5 +1,7 @@
 """System prompts for summarization."""
 
+from .base import SummaryType
+
 # Short response prompt (cleaning for TTS)
 # Used for responses < 300 chars with no tool calls
 PROMPT_SHORT_RESPONSE = """Convert this text for text-to-speech by removing markdown formatting and code blocks. Expand abbreviated units (0.2s -> 0.2 seconds, 100ms -> 100 milliseconds, 5MB -> 5 megabytes). Expand ALL file extensions to full names (.py -> Python, .js -> JavaScript, .yaml -> YAML, .html -> HTML). Output ONLY the cleaned text."""
@@ -38,7 +40,15 @@ Input: Tool: Bash. Input: {"command":"docker ps -a"}
 Output: Permission requested: Command to list all Docker containers"""
 
 
-def get_prompt_and_params(summary_type: "SummaryType") -> tuple[str, float, int]:
+# Prompt and generation parameters per summary type
+_PARAMS: dict[SummaryType, tuple[str, float, int]] = {
+    SummaryType.SHORT_RESPONSE: (PROMPT_SHORT_RESPONSE, 0.3, 2048),
+    SummaryType.LONG_RESPONSE: (PROMPT_LONG_RESPONSE, 0.3, 2048),
+    SummaryType.PERMISSION_REQUEST: (PROMPT_PERMISSION_REQUEST, 0.1, 50),
+}
+
+
+def get_prompt_and_params(summary_type: SummaryType) -> tuple[str, float, int]:
     """Get prompt and generation parameters for a summary type.
 
     Args:
@@ -47,11 +57,4 @@ def get_prompt_and_params(summary_type: "SummaryType") -> tuple[str, float, int]
     Returns:
         Tuple of (prompt, temperature, max_tokens).
     """
-    from .base import SummaryType
-
-    if summary_type == SummaryType.SHORT_RESPONSE:
-        return PROMPT_SHORT_RESPONSE, 0.3, 2048
-    elif summary_type == SummaryType.LONG_RESPONSE:
-        return PROMPT_LONG_RESPONSE, 0.3, 2048
-    else:  # PERMISSION_REQUEST
-        return PROMPT_PERMISSION_REQUEST, 0.1, 50
+    return _PARAMS[summary_type]
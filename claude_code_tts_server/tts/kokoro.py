@@ -1,6 +1,10 @@
 """Kokoro TTS backend implementation."""
 
 import asyncio
+import contextlib
+import contextvars
+import functools
+import time
 from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
@@ -17,25 +21,128 @@ class KokoroTTS(TTSInterface):
 
     SAMPLE_RATE = 24000
     REPO_ID = "hexgrad/Kokoro-82M"
+    CHARS_PER_SECOND = 12  # Used to size the synthesis output buffer
 
     def __init__(self, config: TTSConfig):
         self.config = config
         self.pipeline = None
-        self._executor = ThreadPoolExecutor(max_workers=1)
+        # Dedicated single thread: Kokoro isn't reentrant, and this keeps synthesis
+        # off the loop's default executor
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kokoro-gen")
+        # Replaced with torch.inference_mode once the model is loaded
+        self._inference_context = contextlib.nullcontext
+        # Replaced with a bf16 torch.autocast when TTS_KOKORO_PRECISION=bf16
+        self._autocast_context = contextlib.nullcontext
 
     async def initialize(self) -> None:
         """Load the Kokoro model."""
         log.debug("Loading Kokoro model...")
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
         def load_model():
+            import torch
             from kokoro import KPipeline
-            return KPipeline(lang_code=self.config.kokoro_lang, repo_id=self.REPO_ID)
 
-        self.pipeline = await loop.run_in_executor(self._executor, load_model)
+            self._inference_context = torch.inference_mode
+            self.pipeline = KPipeline(lang_code=self.config.kokoro_lang, repo_id=self.REPO_ID)
+            warmed_up = False
+            if self.config.kokoro_quantize:
+                warmed_up = self._quantize_model()
+            if self.config.kokoro_precision == "bf16":
+                warmed_up = self._enable_bf16() or warmed_up
+            if self.config.kokoro_compile:
+                self._compile_model()
+            elif not warmed_up:
+                # Pay first-call allocation and cache costs before the first request
+                self._warm_up()
+
+        await loop.run_in_executor(self._executor, load_model)
         log.debug("Kokoro model loaded")
 
+    def _warm_up(self) -> None:
+        """Run a throwaway synthesis so the first request hits a warm model."""
+        try:
+            self._generate("Warming up.")
+        except Exception as e:
+            log.warning(f"Kokoro warm-up failed: {e}")
+
+    def _quantize_model(self) -> bool:
+        """Apply dynamic int8 quantization to the Kokoro model's Linear layers.
+
+        Dynamic quantization only has CPU kernels, so it is skipped when the
+        model runs on another device. LSTMs stay in fp32 since Kokoro calls
+        flatten_parameters() on them. Falls back to the fp32 model if a test
+        synthesis fails.
+
+        Returns:
+            True if the test synthesis succeeded (so the model is warmed up).
+        """
+        import torch
+
+        device_type = next(self.pipeline.model.parameters()).device.type
+        if device_type != "cpu":
+            log.warning(f"int8 quantization is CPU-only, skipping on {device_type}")
+            return False
+
+        eager_model = self.pipeline.model
+        self.pipeline.model = torch.ao.quantization.quantize_dynamic(
+            eager_model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+        try:
+            self._generate("Warming up.")
+        except Exception as e:
+            log.warning(f"int8 quantization failed, using fp32 model: {e}")
+            self.pipeline.model = eager_model
+            return False
+        log.debug("Kokoro model quantized to int8")
+        return True
+
+    def _enable_bf16(self) -> bool:
+        """Run the Kokoro forward pass under bf16 autocast.
+
+        Weights stay in fp32; autocast runs matmuls and convolutions in
+        bf16. Falls back to fp32 if a test synthesis fails.
+
+        Returns:
+            True if the test synthesis succeeded (so the model is warmed up).
+        """
+        import torch
+
+        device_type = next(self.pipeline.model.parameters()).device.type
+        self._autocast_context = functools.partial(
+            torch.autocast, device_type=device_type, dtype=torch.bfloat16
+        )
+        try:
+            self._generate("Warming up.")
+        except Exception as e:
+            log.warning(f"bf16 autocast failed, using fp32: {e}")
+            self._autocast_context = contextlib.nullcontext
+            return False
+        log.debug(f"Kokoro using bf16 autocast on {device_type}")
+        return True
+
+    def _compile_model(self) -> None:
+        """Compile the Kokoro model with torch.compile and warm it up.
+
+        The first few calls trigger compilation, so they run here instead of
+        on the first request. Falls back to the eager model if compilation
+        fails.
+        """
+        import torch
+
+        log.debug("Compiling Kokoro model...")
+        eager_model = self.pipeline.model
+        self.pipeline.model = torch.compile(eager_model, mode="reduce-overhead")
+        try:
+            for _ in range(3):
+                self._generate("Warming up.")
+        except Exception as e:
+            log.warning(f"torch.compile failed, using eager model: {e}")
+            self.pipeline.model = eager_model
+            return
+        log.debug("Kokoro model compiled")
+
     async def synthesize(self, text: str) -> np.ndarray | None:
         """Generate TTS audio from text.
 
@@ -45,32 +152,61 @@ class KokoroTTS(TTSInterface):
         Returns:
             Audio as numpy array or None if synthesis failed.
         """
-        import time
-
         if not self.pipeline:
             log.error("Kokoro pipeline not initialized")
             return None
 
-        loop = asyncio.get_event_loop()
-
-        def generate():
-            all_audio = []
-            for _, _, audio in self.pipeline(text, voice=self.config.kokoro_voice):
-                all_audio.append(audio)
-            if not all_audio:
-                return None
-            return np.concatenate(all_audio)
+        loop = asyncio.get_running_loop()
 
         try:
             start = time.perf_counter()
-            audio = await loop.run_in_executor(self._executor, generate)
+            # Run in a copy of the current context so request IDs reach worker-thread logs
+            audio = await loop.run_in_executor(
+                self._executor,
+                functools.partial(contextvars.copy_context().run, self._generate, text),
+            )
             elapsed = time.perf_counter() - start
-            log.trace(f"Kokoro TTS synthesis: {elapsed:.3f}s")
+            log.trace("Kokoro TTS synthesis: %.3fs", elapsed)
             return audio
         except Exception as e:
             log.error(f"TTS generation failed: {e}")
             return None
 
+    def _generate(self, text: str) -> np.ndarray | None:
+        """Run the Kokoro pipeline synchronously (called on the executor thread).
+
+        Args:
+            text: The text to synthesize.
+
+        Returns:
+            Audio as float32 numpy array, or None if nothing was generated.
+        """
+        # Write chunks into one buffer sized from the text length
+        # (grown if needed) instead of concatenating at the end
+        out = np.empty(self._estimate_samples(text), dtype=np.float32)
+        pos = 0
+        with self._inference_context(), self._autocast_context():
+            for _, _, audio in self.pipeline(text, voice=self.config.kokoro_voice):
+                if hasattr(audio, "float"):
+                    # Tensors may come back in bf16, which numpy can't read
+                    audio = audio.float()
+                end = pos + len(audio)
+                if end > len(out):
+                    out = np.resize(out, max(end, 2 * len(out)))
+                out[pos:end] = audio
+                pos = end
+        if pos == 0:
+            return None
+        return out[:pos]
+
+    def _estimate_samples(self, text: str) -> int:
+        """Estimate the number of output samples for a piece of text.
+
+        Assumes roughly 12 characters of speech per second, which slightly
+        overestimates typical Kokoro output.
+        """
+        return max(len(text), 1) * self.SAMPLE_RATE // self.CHARS_PER_SECOND
+
     def get_sample_rate(self) -> int:
         """Return the sample rate (24kHz for Kokoro)."""
         return self.SAMPLE_RATE
@@ -0,0 +1,35 @@
+"""Render the chime and drop tone WAVs shipped in claude_code_tts_server/data.
+
+Run after changing generate_chime() or generate_drop_tone():
+
+    uv run python scripts/gen_sounds.py
+"""
+
+from pathlib import Path
+
+import soundfile as sf
+
+from claude_code_tts_server.core.sounds import (
+    SOUND_DATA_SAMPLE_RATE,
+    generate_chime,
+    generate_drop_tone,
+)
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "claude_code_tts_server" / "data"
+
+
+def main() -> None:
+    """Generate and write the packaged sound effect files."""
+    DATA_DIR.mkdir(exist_ok=True)
+    sounds = {
+        "chime_24k.wav": generate_chime(SOUND_DATA_SAMPLE_RATE),
+        "drop_24k.wav": generate_drop_tone(SOUND_DATA_SAMPLE_RATE),
+    }
+    for name, audio in sounds.items():
+        path = DATA_DIR / name
+        sf.write(path, audio, SOUND_DATA_SAMPLE_RATE)
+        print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,46 +1,83 @@
 """Pytest fixtures for Claude Code TTS Server tests."""
 
-import json
-from unittest.mock import AsyncMock, MagicMock
-
 import numpy as np
+import orjson
 import pytest
 
 from claude_code_tts_server.config import AudioConfig, ServerConfig, SummarizerConfig, TTSConfig
 from claude_code_tts_server.core.audio_manager import AudioManager
-from claude_code_tts_server.summarizers.base import SummaryResult
+from claude_code_tts_server.summarizers.base import SummarizerInterface, SummaryRequest, SummaryResult
 from claude_code_tts_server.tts.base import TTSInterface
 
 
-@pytest.fixture
+# 1 second of silence, allocated once per process
+_SAMPLE_AUDIO = np.zeros(24000, dtype=np.float32)
+_SAMPLE_AUDIO.setflags(write=False)
+
+
+class StubTTS(TTSInterface):
+    """Lightweight TTS backend returning canned audio."""
+
+    def __init__(self, audio: np.ndarray, sample_rate: int = 24000):
+        self.audio = audio
+        self.sample_rate = sample_rate
+        self.calls: list[str] = []
+
+    async def initialize(self) -> None:
+        pass
+
+    async def synthesize(self, text: str) -> np.ndarray | None:
+        self.calls.append(text)
+        return self.audio
+
+    def get_sample_rate(self) -> int:
+        return self.sample_rate
+
+    async def cleanup(self) -> None:
+        pass
+
+
+class StubSummarizer(SummarizerInterface):
+    """Lightweight summarizer returning a canned result."""
+
+    def __init__(self, result: SummaryResult, healthy: bool = True):
+        self.result = result
+        self.healthy = healthy
+        self.calls: list[SummaryRequest] = []
+
+    async def summarize(self, request: SummaryRequest) -> SummaryResult:
+        self.calls.append(request)
+        return self.result
+
+    async def health_check(self) -> bool:
+        return self.healthy
+
+
+@pytest.fixture(scope="session")
 def sample_audio():
-    """Generate sample audio data."""
-    return np.zeros(24000, dtype=np.float32)  # 1 second of silence
+    """Get sample audio data (shared and read-only; use .copy() to modify)."""
+    return _SAMPLE_AUDIO
 
 
 @pytest.fixture
 def mock_tts(sample_audio):
-    """Create a mock TTS backend."""
-    tts = AsyncMock(spec=TTSInterface)
-    tts.synthesize.return_value = sample_audio
-    tts.get_sample_rate.return_value = 24000
-    return tts
+    """Create a stub TTS backend."""
+    return StubTTS(sample_audio)
 
 
 @pytest.fixture
 def mock_summarizer():
-    """Create a mock summarizer."""
-    summarizer = AsyncMock()
-    summarizer.summarize.return_value = SummaryResult(
-        text="Test summary",
-        model_used="test-model",
-        tokens_used=100,
+    """Create a stub summarizer."""
+    return StubSummarizer(
+        SummaryResult(
+            text="Test summary",
+            model_used="test-model",
+            tokens_used=100,
+        )
     )
-    summarizer.health_check.return_value = True
-    return summarizer
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def audio_config():
     """Create default audio config."""
     return AudioConfig(
@@ -53,7 +90,7 @@ def audio_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tts_config():
     """Create default TTS config."""
     return TTSConfig(
@@ -63,7 +100,7 @@ def tts_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def summarizer_config():
     """Create default summarizer config."""
     return SummarizerConfig(
@@ -74,7 +111,7 @@ def summarizer_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def server_config(tts_config, summarizer_config, audio_config):
     """Create default server config."""
     return ServerConfig(
@@ -87,100 +124,114 @@ def server_config(tts_config, summarizer_config, audio_config):
     )
 
 
-def _entries_to_jsonl(entries: list[dict]) -> str:
-    """Convert list of entries to JSONL string."""
-    return "\n".join(json.dumps(entry) for entry in entries)
-
-
 @pytest.fixture
-def sample_transcript_jsonl():
+def audio_manager(audio_config, mock_tts, mock_summarizer):
+    """Create an AudioManager with stub backends (workers not started)."""
+    return AudioManager(audio_config, mock_tts, mock_summarizer)
+
+
+# Entries behind the sample_transcript_* fixtures
+_SIMPLE_ENTRIES = [
+    {
+        "type": "user",
+        "message": {
+            "content": [{"type": "text", "text": "Hello, can you help me?"}]
+        }
+    },
+    {
+        "type": "assistant",
+        "message": {
+            "content": [
+                {"type": "text", "text": "Of course! I'd be happy to help you."}
+            ]
+        }
+    },
+]
+
+_TOOLS_ENTRIES = [
+    {
+        "type": "user",
+        "message": {
+            "content": [{"type": "text", "text": "Run the tests"}]
+        }
+    },
+    {
+        "type": "assistant",
+        "message": {
+            "content": [
+                {"type": "text", "text": "I'll run the tests for you."},
+                {
+                    "type": "tool_use",
+                    "name": "Bash",
+                    "input": {"command": "pytest", "description": "Run tests"}
+                }
+            ]
+        }
+    },
+]
+
+_INTERRUPT_ENTRIES = [
+    {
+        "type": "user",
+        "message": {
+            "content": [{"type": "text", "text": "Delete all files"}]
+        }
+    },
+    {
+        "type": "assistant",
+        "message": {
+            "content": [
+                {
+                    "type": "tool_use",
+                    "name": "Bash",
+                    "input": {"command": "rm -rf /"}
+                }
+            ]
+        }
+    },
+    {
+        "type": "user",
+        "message": {
+            "content": [
+                {
+                    "type": "tool_result",
+                    "content": "The user doesn't want to proceed with this action."
+                }
+            ]
+        }
+    },
+    {
+        "type": "assistant",
+        "message": {
+            "content": [
+                {"type": "text", "text": "Understood, I won't proceed with that command."}
+            ]
+        }
+    },
+]
+
+
+@pytest.fixture(scope="session")
+def make_transcript():
+    """Get a factory converting a list of entries to transcript JSONL content."""
+    def _make(entries: list[dict]) -> str:
+        return b"\n".join(orjson.dumps(entry) for entry in entries).decode()
+    return _make
+
+
+@pytest.fixture(scope="session")
+def sample_transcript_jsonl(make_transcript):
     """Sample transcript JSONL content."""
-    entries = [
-        {
-            "type": "user",
-            "message": {
-                "content": [{"type": "text", "text": "Hello, can you help me?"}]
-            }
-        },
-        {
-            "type": "assistant",
-            "message": {
-                "content": [
-                    {"type": "text", "text": "Of course! I'd be happy to help you."}
-                ]
-            }
-        },
-    ]
-    return _entries_to_jsonl(entries)
+    return make_transcript(_SIMPLE_ENTRIES)
 
 
-@pytest.fixture
-def sample_transcript_with_tools():
+@pytest.fixture(scope="session")
+def sample_transcript_with_tools(make_transcript):
     """Sample transcript with tool calls."""
-    entries = [
-        {
-            "type": "user",
-            "message": {
-                "content": [{"type": "text", "text": "Run the tests"}]
-            }
-        },
-        {
-            "type": "assistant",
-            "message": {
-                "content": [
-                    {"type": "text", "text": "I'll run the tests for you."},
-                    {
-                        "type": "tool_use",
-                        "name": "Bash",
-                        "input": {"command": "pytest", "description": "Run tests"}
-                    }
-                ]
-            }
-        },
-    ]
-    return _entries_to_jsonl(entries)
+    return make_transcript(_TOOLS_ENTRIES)
 
 
-@pytest.fixture
-def sample_transcript_with_interrupt():
+@pytest.fixture(scope="session")
+def sample_transcript_with_interrupt(make_transcript):
     """Sample transcript with an interrupt."""
-    entries = [
-        {
-            "type": "user",
-            "message": {
-                "content": [{"type": "text", "text": "Delete all files"}]
-            }
-        },
-        {
-            "type": "assistant",
-            "message": {
-                "content": [
-                    {
-                        "type": "tool_use",
-                        "name": "Bash",
-                        "input": {"command": "rm -rf /"}
-                    }
-                ]
-            }
-        },
-        {
-            "type": "user",
-            "message": {
-                "content": [
-                    {
-                        "type": "tool_result",
-                        "content": "The user doesn't want to proceed with this action."
-                    }
-                ]
-            }
-        },
-        {
-            "type": "assistant",
-            "message": {
-                "content": [
-                    {"type": "text", "text": "Understood, I won't proceed with that command."}
-                ]
-            }
-        },
-    ]
-    return _entries_to_jsonl(entries)
+    return make_transcript(_INTERRUPT_ENTRIES)
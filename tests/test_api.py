@@ -7,7 +7,6 @@ from unittest.mock import AsyncMock, MagicMock
 
 from claude_code_tts_server.api.routes import router
 from claude_code_tts_server.core.audio_manager import QueueStatus
-from claude_code_tts_server.summarizers.base import SummaryResult
 
 
 @pytest.fixture
@@ -28,19 +27,6 @@ def mock_audio_manager():
     return manager
 
 
-@pytest.fixture
-def mock_summarizer():
-    """Create a mock summarizer."""
-    summarizer = AsyncMock()
-    summarizer.summarize = AsyncMock(return_value=SummaryResult(
-        text="Test summary",
-        model_used="test-model",
-        tokens_used=100,
-    ))
-    summarizer.health_check = AsyncMock(return_value=True)
-    return summarizer
-
-
 @pytest.fixture
 def app(mock_audio_manager, mock_summarizer):
     """Create test FastAPI app."""
@@ -72,6 +58,15 @@ class TestHealthEndpoint:
         assert data["queue_depth"] == 0
 
 
+    def test_health_check_summarizer_unavailable(self, client, mock_summarizer):
+        """Test health check reports an unreachable summarizer backend."""
+        mock_summarizer.healthy = False
+
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        assert response.json()["summarizer_ready"] is False
+
 class TestSpeakEndpoint:
     """Tests for /speak endpoint."""
 
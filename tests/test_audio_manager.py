@@ -0,0 +1,240 @@
+"""Tests for the audio pipeline queues."""
+
+import asyncio
+import time
+
+import pytest
+
+from claude_code_tts_server.core import playback
+from claude_code_tts_server.core.audio_manager import AudioManager, ReadyAudio, RequestType
+from claude_code_tts_server.core.playback import AudioPlayer
+from claude_code_tts_server.summarizers.base import SummaryType
+
+
+class TestAudioPipelineQueues:
+    """Tests for queueing and clearing the pipeline (workers not started)."""
+
+    @pytest.mark.asyncio
+    async def test_add_message(self, audio_manager):
+        """Test that messages are queued in order."""
+        await audio_manager.add_message("first")
+        await audio_manager.add_message("second")
+
+        assert [m.text for m in audio_manager.pending_messages] == ["first", "second"]
+        assert audio_manager.get_status().pending_messages == 2
+
+    @pytest.mark.asyncio
+    async def test_add_request_drops_oldest_when_full(self, audio_manager):
+        """Test that queue mode drops the oldest request past max_queue."""
+        max_queue = audio_manager.config.max_queue
+        for i in range(max_queue + 1):
+            await audio_manager.add_request(
+                RequestType.SUMMARIZE, f"request {i}", SummaryType.SHORT_RESPONSE
+            )
+
+        contents = [r.content for r in audio_manager.pending_requests]
+        assert len(contents) == max_queue
+        assert contents[0] == "request 1"
+        assert contents[-1] == f"request {max_queue}"
+
+    @pytest.mark.asyncio
+    async def test_clear_queue(self, audio_manager, tmp_path):
+        """Test that clear_queue empties every stage and deletes ready audio files."""
+        audio_file = tmp_path / "ready.wav"
+        audio_file.touch()
+        audio_manager.ready_audio.append(ReadyAudio("id", None, audio_file, "ready"))
+        await audio_manager.add_request(RequestType.SPEAK, "speak")
+        await audio_manager.add_message("message")
+
+        assert await audio_manager.clear_queue() == 3
+        assert not audio_file.exists()
+        status = audio_manager.get_status()
+        assert (status.pending_requests, status.pending_messages, status.ready_audio) == (0, 0, 0)
+
+
+@pytest.fixture
+def player_starts(monkeypatch):
+    """Replace the audio player with a short sleep; record start times by file name.
+
+    Files named "short*" play for 0.1s, anything else for 2s.
+    """
+    starts: dict[str, float] = {}
+
+    async def spawn(audio_file, volume=1.0):
+        starts[audio_file.stem] = time.monotonic()
+        duration = "0.1" if audio_file.stem.startswith("short") else "2"
+        return await asyncio.create_subprocess_exec("sleep", duration)
+
+    monkeypatch.setattr(playback, "_spawn_player", spawn)
+    return starts
+
+
+async def _run_worker_until(audio_manager, worker, condition, timeout: float = 2.0) -> None:
+    """Run one pipeline worker until condition() holds, then stop it."""
+    task = asyncio.create_task(worker())
+    try:
+        async with asyncio.timeout(timeout):
+            while not condition():
+                await asyncio.sleep(0.01)
+    finally:
+        audio_manager.shutdown_event.set()
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+
+class TestAudioPipelineStages:
+    """Tests for the summarizer and generator workers handing off between stages."""
+
+    @pytest.mark.asyncio
+    async def test_summarize_request_queues_summary(self, audio_manager, mock_summarizer):
+        """Test that a summarize request goes through the summarizer into the message queue."""
+        await audio_manager.add_request(
+            RequestType.SUMMARIZE, "Long response", SummaryType.LONG_RESPONSE
+        )
+
+        await _run_worker_until(
+            audio_manager,
+            audio_manager._summarizer_worker,
+            lambda: bool(audio_manager.pending_messages),
+        )
+
+        [request] = mock_summarizer.calls
+        assert (request.content, request.summary_type) == ("Long response", SummaryType.LONG_RESPONSE)
+        assert [m.text for m in audio_manager.pending_messages] == ["Test summary"]
+
+    @pytest.mark.asyncio
+    async def test_message_synthesized_into_ready_audio(self, audio_manager, mock_tts):
+        """Test that a pending message is synthesized and its audio file queued."""
+        await audio_manager.add_message("Hello")
+
+        await _run_worker_until(
+            audio_manager,
+            audio_manager._generator_worker,
+            lambda: bool(audio_manager.ready_audio),
+        )
+
+        assert mock_tts.calls == ["Hello"]
+        [ready] = audio_manager.ready_audio
+        assert ready.text == "Hello"
+        assert ready.audio_file.exists()
+        await audio_manager.clear_queue()
+
+
+class TestAudioPipelineQueueLimits:
+    """Tests for max_queue limits applied inside the workers."""
+
+    @pytest.mark.asyncio
+    async def test_summarizer_drops_oldest_message_when_full(self, audio_manager):
+        """Test that a processed request pushes out the oldest pending message."""
+        max_queue = audio_manager.config.max_queue
+        for i in range(max_queue):
+            await audio_manager.add_message(f"message {i}")
+        await audio_manager.add_request(RequestType.SPEAK, "spoken")
+
+        await _run_worker_until(
+            audio_manager,
+            audio_manager._summarizer_worker,
+            lambda: audio_manager.pending_messages[-1].text == "spoken",
+        )
+
+        texts = [m.text for m in audio_manager.pending_messages]
+        assert len(texts) == max_queue
+        assert texts[0] == "message 1"
+        assert texts[-1] == "spoken"
+
+    @pytest.mark.asyncio
+    async def test_generator_drops_oldest_ready_audio_when_full(self, audio_manager, tmp_path):
+        """Test that new audio pushes out the oldest ready clip and deletes its file."""
+        max_queue = audio_manager.config.max_queue
+        files = []
+        for i in range(max_queue):
+            audio_file = tmp_path / f"ready{i}.wav"
+            audio_file.touch()
+            files.append(audio_file)
+            audio_manager.ready_audio.append(ReadyAudio(str(i), None, audio_file, f"ready {i}"))
+        await audio_manager.add_message("new")
+
+        await _run_worker_until(
+            audio_manager,
+            audio_manager._generator_worker,
+            lambda: audio_manager.ready_audio[-1].text == "new",
+        )
+
+        texts = [a.text for a in audio_manager.ready_audio]
+        assert len(texts) == max_queue
+        assert texts[0] == "ready 1"
+        assert texts[-1] == "new"
+        assert not files[0].exists()
+        assert all(f.exists() for f in files[1:])
+        await audio_manager.clear_queue()
+
+
+class TestAudioPlayer:
+    """Tests for AudioPlayer process tracking (player stubbed with sleep)."""
+
+    @pytest.mark.asyncio
+    async def test_finished_event_set_on_natural_exit(self, player_starts, tmp_path):
+        """Test that finished_event fires when the clip ends and check_finished reports it."""
+        player = AudioPlayer()
+        audio_file = tmp_path / "short.wav"
+        assert await player.play(audio_file)
+        assert player.is_playing()
+
+        await asyncio.wait_for(player.finished_event.wait(), timeout=1.0)
+
+        assert not player.is_playing()
+        assert player.check_finished() == audio_file
+        assert player.current_process is None
+
+    @pytest.mark.asyncio
+    async def test_finished_event_ignores_superseded_process(self, player_starts, tmp_path):
+        """Test that a replaced process exiting does not signal the current one."""
+        player = AudioPlayer()
+        await player.play(tmp_path / "short.wav")
+        await player.play(tmp_path / "long.wav")
+
+        await asyncio.sleep(0.3)
+
+        assert not player.finished_event.is_set()
+        assert player.is_playing()
+        assert player.check_finished() is None
+        assert await player.stop() == tmp_path / "long.wav"
+
+
+class TestPlaybackWorker:
+    """Tests for the playback worker's timing (player stubbed with sleep)."""
+
+    @pytest.mark.asyncio
+    async def test_queued_audio_starts_when_short_clip_ends(
+        self, audio_config, mock_tts, mock_summarizer, player_starts, tmp_path
+    ):
+        """Test that a clip shorter than min_duration does not delay the next one."""
+        config = audio_config.model_copy(update={"min_duration": 1.5})
+        manager = AudioManager(config, mock_tts, mock_summarizer)
+
+        async def enqueue(name: str) -> None:
+            audio_file = tmp_path / f"{name}.wav"
+            audio_file.touch()
+            async with manager.audio_lock:
+                manager.ready_audio.append(ReadyAudio(name, None, audio_file, name))
+            manager.audio_ready_event.set()
+
+        async def enqueue_next_during_short() -> None:
+            while "short" not in player_starts:
+                await asyncio.sleep(0.01)
+            await enqueue("next")
+
+        await enqueue("short")
+        feeder = asyncio.create_task(enqueue_next_during_short())
+        # Times out if the worker waits out min_duration after the short clip
+        await _run_worker_until(
+            manager, manager._playback_worker, lambda: "next" in player_starts, timeout=1.0
+        )
+        await feeder
+
+        assert player_starts["next"] - player_starts["short"] < 0.5
+        assert not (tmp_path / "short.wav").exists()
+        await manager.player.stop()
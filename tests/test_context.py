@@ -0,0 +1,65 @@
+"""Tests for request context utilities."""
+
+from claude_code_tts_server.core.context import (
+    get_request_id,
+    request_id_scope,
+    sanitize_for_log,
+    set_request_id,
+)
+
+
+class TestRequestIdScope:
+    """Tests for request_id_scope context manager."""
+
+    def test_generates_id(self):
+        """Test that a request ID is generated when none is given."""
+        with request_id_scope() as request_id:
+            assert len(request_id) == 8
+            assert get_request_id() == request_id
+        assert get_request_id() is None
+
+    def test_uses_given_id(self):
+        """Test that an explicit request ID is used."""
+        with request_id_scope("abc123") as request_id:
+            assert request_id == "abc123"
+            assert get_request_id() == "abc123"
+
+    def test_nested_scopes_restore(self):
+        """Test that nested scopes restore the outer request ID."""
+        with request_id_scope("outer"):
+            with request_id_scope("inner"):
+                assert get_request_id() == "inner"
+            assert get_request_id() == "outer"
+        assert get_request_id() is None
+
+    def test_restores_on_exception(self):
+        """Test that the previous request ID is restored on error."""
+        try:
+            with request_id_scope("failing"):
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+        assert get_request_id() is None
+
+    def test_set_request_id_generates(self):
+        """Test that set_request_id generates an 8-char hex ID."""
+        with request_id_scope("outer"):
+            request_id = set_request_id()
+            assert len(request_id) == 8
+            int(request_id, 16)
+
+
+class TestSanitizeForLog:
+    """Tests for sanitize_for_log function."""
+
+    def test_replaces_newlines(self):
+        """Test that newlines are escaped and carriage returns dropped."""
+        assert sanitize_for_log("a\nb\r\nc") == "a\\nb\\nc"
+
+    def test_truncates(self):
+        """Test that long text is truncated with an ellipsis."""
+        assert sanitize_for_log("x" * 100, max_len=10) == "x" * 10 + "..."
+
+    def test_short_text_unchanged(self):
+        """Test that short clean text is returned as-is."""
+        assert sanitize_for_log("hello") == "hello"
@@ -0,0 +1,58 @@
+"""Tests for the Kokoro TTS backend (with a fake pipeline)."""
+
+import numpy as np
+import pytest
+
+from claude_code_tts_server.tts.kokoro import KokoroTTS
+
+
+def _fake_pipeline(chunks: list[np.ndarray]):
+    """Build a callable mimicking KPipeline's (graphemes, phonemes, audio) output."""
+    def pipeline(text, voice=None):
+        for chunk in chunks:
+            yield text, "", chunk
+    return pipeline
+
+
+class TestKokoroSynthesize:
+    """Tests for KokoroTTS.synthesize."""
+
+    @pytest.fixture
+    def tts(self, tts_config):
+        """Create a KokoroTTS instance without loading the model."""
+        tts = KokoroTTS(tts_config)
+        yield tts
+        tts._executor.shutdown(wait=False)
+
+    @pytest.mark.asyncio
+    async def test_joins_chunks(self, tts):
+        """Test that chunks are joined in order."""
+        chunks = [np.full(100, i, dtype=np.float32) for i in range(3)]
+        tts.pipeline = _fake_pipeline(chunks)
+
+        audio = await tts.synthesize("Hi")
+
+        np.testing.assert_array_equal(audio, np.concatenate(chunks))
+        assert audio.dtype == np.float32
+
+    @pytest.mark.asyncio
+    async def test_grows_past_estimate(self, tts):
+        """Test output longer than the size estimate is kept intact."""
+        chunks = [np.random.rand(50000).astype(np.float32) for _ in range(3)]
+        tts.pipeline = _fake_pipeline(chunks)
+
+        audio = await tts.synthesize("Hi")
+
+        np.testing.assert_array_equal(audio, np.concatenate(chunks))
+
+    @pytest.mark.asyncio
+    async def test_no_audio(self, tts):
+        """Test that an empty pipeline result returns None."""
+        tts.pipeline = _fake_pipeline([])
+
+        assert await tts.synthesize("Hi") is None
+
+    @pytest.mark.asyncio
+    async def test_not_initialized(self, tts):
+        """Test that synthesize returns None before initialize."""
+        assert await tts.synthesize("Hi") is None
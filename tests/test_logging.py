@@ -0,0 +1,44 @@
+"""Tests for TRACE logging support."""
+
+import logging
+
+import pytest
+
+from claude_code_tts_server.core.logging import TRACE, get_logger, set_trace_enabled
+
+
+@pytest.fixture
+def trace_logger(caplog):
+    """Logger at TRACE level; restores the real trace method afterwards."""
+    logger = get_logger("tts-server-test")
+    logger.setLevel(TRACE)
+    caplog.set_level(TRACE, logger="tts-server-test")
+    yield logger
+    set_trace_enabled(True)
+
+
+class TestTraceLogging:
+    """Tests for Logger.trace and set_trace_enabled."""
+
+    def test_trace_enabled(self, trace_logger, caplog):
+        """Test that trace messages are emitted when enabled."""
+        set_trace_enabled(True)
+        trace_logger.trace("value: %d", 42)
+
+        assert [r.getMessage() for r in caplog.records] == ["value: 42"]
+        assert caplog.records[0].levelno == TRACE
+
+    def test_trace_disabled(self, trace_logger, caplog):
+        """Test that trace messages are dropped when disabled."""
+        set_trace_enabled(False)
+        trace_logger.trace("value: %d", 42)
+
+        assert caplog.records == []
+
+    def test_trace_respects_level(self, trace_logger, caplog):
+        """Test that the real trace method still checks the logger level."""
+        set_trace_enabled(True)
+        trace_logger.setLevel(logging.DEBUG)
+        trace_logger.trace("hidden")
+
+        assert caplog.records == []
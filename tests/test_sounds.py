@@ -90,9 +90,11 @@ class TestSaveAudio:
         audio = np.random.randn(24000).astype(np.float32) * 0.1
         path = save_audio(audio, 24000)
 
-        data, sr = sf.read(path)
+        data, sr = sf.read(path, dtype="float32")
         assert sr == 24000
         assert len(data) == len(audio)
+        np.testing.assert_array_equal(data, audio)
+        assert sf.info(path).subtype == "FLOAT"
 
         # Cleanup
         os.unlink(path)
@@ -130,7 +132,7 @@ class TestSoundManager:
     """Tests for SoundManager class."""
 
     def test_init_sounds(self):
-        """Test that init_sounds creates files."""
+        """Test that init_sounds uses the packaged files."""
         manager = SoundManager()
         manager.init_sounds()
 
@@ -141,8 +143,23 @@ class TestSoundManager:
 
         manager.cleanup()
 
-    def test_cleanup(self):
-        """Test that cleanup removes files."""
+    def test_packaged_sounds_match_generators(self):
+        """Test that packaged WAVs match the current generator output."""
+        import soundfile as sf
+
+        manager = SoundManager()
+        manager.init_sounds()
+
+        chime, sr = sf.read(manager.chime_file, dtype="float32")
+        assert sr == 24000
+        np.testing.assert_allclose(chime, generate_chime(24000), atol=1e-4)
+
+        drop, sr = sf.read(manager.drop_file, dtype="float32")
+        assert sr == 24000
+        np.testing.assert_allclose(drop, generate_drop_tone(24000), atol=1e-4)
+
+    def test_cleanup_keeps_packaged_files(self):
+        """Test that cleanup does not delete the packaged files."""
         manager = SoundManager()
         manager.init_sounds()
 
@@ -151,6 +168,31 @@ class TestSoundManager:
 
         manager.cleanup()
 
+        assert manager.chime_file is None
+        assert manager.drop_file is None
+        assert chime_path.exists()
+        assert drop_path.exists()
+
+    def test_init_sounds_other_sample_rate(self):
+        """Test that a non-default sample rate generates temp files."""
+        manager = SoundManager(sample_rate=16000)
+        manager.init_sounds()
+
+        assert manager.chime_file.exists()
+        assert manager.drop_file.exists()
+
+        manager.cleanup()
+
+    def test_cleanup(self):
+        """Test that cleanup removes generated files."""
+        manager = SoundManager(sample_rate=16000)
+        manager.init_sounds()
+
+        chime_path = manager.chime_file
+        drop_path = manager.drop_file
+
+        manager.cleanup()
+
         assert manager.chime_file is None
         assert manager.drop_file is None
         assert not chime_path.exists()
@@ -158,7 +200,7 @@ class TestSoundManager:
 
     def test_cleanup_handles_missing_files(self):
         """Test that cleanup handles already-deleted files."""
-        manager = SoundManager()
+        manager = SoundManager(sample_rate=16000)
         manager.init_sounds()
 
         # Manually delete files
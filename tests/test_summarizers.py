@@ -1,10 +1,19 @@
 """Tests for summarizer backends."""
 
+import asyncio
+
+import httpx
 import pytest
-from pytest_httpx import HTTPXMock
 
 from claude_code_tts_server.config import SummarizerConfig
-from claude_code_tts_server.summarizers.base import SummaryRequest, SummaryType
+from claude_code_tts_server.summarizers.base import (
+    MAX_ATTEMPTS,
+    SummaryRequest,
+    SummaryType,
+    _env_proxy_mounts,
+    create_http_client,
+    extract_openai_response,
+)
 from claude_code_tts_server.summarizers.groq import GroqSummarizer
 from claude_code_tts_server.summarizers.ollama import OllamaSummarizer
 from claude_code_tts_server.summarizers.prompts import (
@@ -15,44 +24,167 @@ from claude_code_tts_server.summarizers.prompts import (
 )
 
 
-class TestPrompts:
-    """Tests for prompt selection."""
+# Per-backend (chat completions URL, health check URL, health check failure status)
+BACKEND_URLS = {
+    "groq": (
+        "https://api.groq.com/openai/v1/chat/completions",
+        "https://api.groq.com/openai/v1/models",
+        401,
+    ),
+    "ollama": (
+        "http://localhost:11434/v1/chat/completions",
+        "http://localhost:11434/api/tags",
+        500,
+    ),
+}
 
-    def test_short_response_prompt(self):
-        """Test short response prompt selection."""
-        prompt, temp, max_tokens = get_prompt_and_params(SummaryType.SHORT_RESPONSE)
-        assert prompt == PROMPT_SHORT_RESPONSE
-        assert temp == 0.3
-        assert max_tokens == 2048
 
-    def test_long_response_prompt(self):
-        """Test long response prompt selection."""
-        prompt, temp, max_tokens = get_prompt_and_params(SummaryType.LONG_RESPONSE)
-        assert prompt == PROMPT_LONG_RESPONSE
-        assert temp == 0.3
-        assert max_tokens == 2048
+class FakeAPI:
+    """Canned HTTP responses served through httpx.MockTransport.
 
-    def test_permission_request_prompt(self):
-        """Test permission request prompt selection."""
-        prompt, temp, max_tokens = get_prompt_and_params(SummaryType.PERMISSION_REQUEST)
-        assert prompt == PROMPT_PERMISSION_REQUEST
-        assert temp == 0.1
-        assert max_tokens == 50
+    Responses registered for a URL are returned in order, one per request.
+    """
 
+    def __init__(self):
+        self.responses: dict[str, list[httpx.Response]] = {}
+        self.requests: list[httpx.Request] = []
 
-class TestGroqSummarizer:
-    """Tests for GroqSummarizer."""
+    def add_response(self, url: str, status_code: int = 200, json: dict | None = None) -> None:
+        """Queue a response for the next request to url."""
+        self.responses.setdefault(url, []).append(httpx.Response(status_code, json=json))
+
+    def reset(self) -> None:
+        """Forget all responses and recorded requests."""
+        self.responses.clear()
+        self.requests.clear()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        """Serve the next queued response for the request URL."""
+        self.requests.append(request)
+        queued = self.responses.get(str(request.url))
+        if not queued:
+            pytest.fail(f"Unexpected request: {request.method} {request.url}")
+        return queued.pop(0)
+
+
+def _stub_get(monkeypatch, client: httpx.AsyncClient, status_code: int) -> list[str]:
+    """Make client.get return status_code without a request; returns the URLs it was called with."""
+    urls = []
+
+    async def get(url, **kwargs):
+        urls.append(url)
+        return httpx.Response(status_code)
+
+    monkeypatch.setattr(client, "get", get)
+    return urls
+
+
+@pytest.fixture(scope="module")
+def fake_api():
+    """Shared FakeAPI for the module."""
+    return FakeAPI()
+
+
+@pytest.fixture(scope="module")
+def http_client(fake_api):
+    """Shared client routing all requests to fake_api (no sockets, so nothing to close)."""
+    return httpx.AsyncClient(transport=httpx.MockTransport(fake_api.handler))
+
+
+@pytest.fixture(scope="module")
+def ollama_config():
+    """Create Ollama config."""
+    return SummarizerConfig(
+        backend="ollama",
+        ollama_url="http://localhost:11434",
+        ollama_model_large="test-model-large",
+        ollama_model_small="test-model-small",
+    )
 
-    @pytest.fixture
-    def summarizer(self, summarizer_config):
-        """Create a GroqSummarizer instance."""
-        return GroqSummarizer(summarizer_config)
+
+@pytest.fixture(scope="module")
+def groq_summarizer(summarizer_config, http_client):
+    """Create a GroqSummarizer shared by the module (it holds no per-test state)."""
+    return GroqSummarizer(summarizer_config, client=http_client)
+
+
+@pytest.fixture(scope="module", params=["groq", "ollama"])
+def backend(request, groq_summarizer, ollama_config, http_client):
+    """Create each summarizer along with its URLs."""
+    if request.param == "groq":
+        summarizer = groq_summarizer
+    else:
+        summarizer = OllamaSummarizer(ollama_config, client=http_client)
+    return (summarizer, *BACKEND_URLS[request.param])
+
+
+@pytest.fixture
+def proxy_env(monkeypatch):
+    """Clear proxy variables from the environment; returns monkeypatch to set them."""
+    for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.lower(), raising=False)
+    return monkeypatch
+
+
+@pytest.fixture
+def api(fake_api):
+    """Give each test a clean FakeAPI and check all its responses were used."""
+    fake_api.reset()
+    yield fake_api
+    unused = [url for url, queued in fake_api.responses.items() if queued]
+    assert not unused, f"Responses never requested: {unused}"
+
+
+class TestPrompts:
+    """Tests for prompt selection."""
+
+    @pytest.mark.parametrize(
+        "summary_type,expected_prompt,expected_temp,expected_max_tokens",
+        [
+            (SummaryType.SHORT_RESPONSE, PROMPT_SHORT_RESPONSE, 0.3, 2048),
+            (SummaryType.LONG_RESPONSE, PROMPT_LONG_RESPONSE, 0.3, 2048),
+            (SummaryType.PERMISSION_REQUEST, PROMPT_PERMISSION_REQUEST, 0.1, 50),
+        ],
+        ids=["short_response", "long_response", "permission_request"],
+    )
+    def test_prompt_selection(self, summary_type, expected_prompt, expected_temp, expected_max_tokens):
+        """Test prompt and parameters selected for each summary type."""
+        prompt, temp, max_tokens = get_prompt_and_params(summary_type)
+        assert prompt == expected_prompt
+        assert temp == expected_temp
+        assert max_tokens == expected_max_tokens
+
+
+class TestExtractOpenAIResponse:
+    """Tests for extract_openai_response."""
+
+    def test_text_and_tokens(self):
+        """Test extracting text and token usage."""
+        data = {
+            "choices": [{"message": {"content": "Hello"}}],
+            "usage": {"total_tokens": 42},
+        }
+        assert extract_openai_response(data) == ("Hello", 42)
+
+    def test_missing_usage(self):
+        """Test that missing or null usage yields None tokens."""
+        data = {"choices": [{"message": {"content": "Hello"}}]}
+        assert extract_openai_response(data) == ("Hello", None)
+
+        data["usage"] = None
+        assert extract_openai_response(data) == ("Hello", None)
+
+
+class TestSummarizerBackends:
+    """Behavior shared by the Groq and Ollama summarizers."""
 
     @pytest.mark.asyncio
-    async def test_summarize_short_response(self, summarizer, httpx_mock: HTTPXMock):
-        """Test summarizing a short response."""
-        httpx_mock.add_response(
-            url="https://api.groq.com/openai/v1/chat/completions",
+    async def test_summarize_short_response(self, backend, api):
+        """Test summarizing a short response uses the small model."""
+        summarizer, chat_url, _, _ = backend
+        api.add_response(
+            url=chat_url,
             json={
                 "choices": [{"message": {"content": "Cleaned text"}}],
                 "usage": {"total_tokens": 50},
@@ -70,10 +202,11 @@ class TestGroqSummarizer:
         assert result.tokens_used == 50
 
     @pytest.mark.asyncio
-    async def test_summarize_long_response(self, summarizer, httpx_mock: HTTPXMock):
-        """Test summarizing a long response."""
-        httpx_mock.add_response(
-            url="https://api.groq.com/openai/v1/chat/completions",
+    async def test_summarize_long_response(self, backend, api):
+        """Test summarizing a long response uses the large model."""
+        summarizer, chat_url, _, _ = backend
+        api.add_response(
+            url=chat_url,
             json={
                 "choices": [{"message": {"content": "I updated the files."}}],
                 "usage": {"total_tokens": 100},
@@ -90,9 +223,74 @@ class TestGroqSummarizer:
         assert result.model_used == "test-model-large"
 
     @pytest.mark.asyncio
-    async def test_summarize_permission_request(self, summarizer, httpx_mock: HTTPXMock):
+    async def test_health_check_success(self, backend, monkeypatch):
+        """Test successful health check."""
+        summarizer, _, health_url, _ = backend
+        urls = _stub_get(monkeypatch, summarizer.client, 200)
+
+        result = await summarizer.health_check()
+        assert result is True
+        assert urls == [health_url]
+
+    @pytest.mark.asyncio
+    async def test_health_check_failure(self, backend, monkeypatch):
+        """Test failed health check."""
+        summarizer, _, health_url, failure_status = backend
+        urls = _stub_get(monkeypatch, summarizer.client, failure_status)
+
+        result = await summarizer.health_check()
+        assert result is False
+        assert urls == [health_url]
+
+
+class TestCreateHttpClient:
+    """Tests for the shared summarizer HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_routes_through_https_proxy(self, proxy_env):
+        """Test that HTTPS_PROXY is honored despite the custom transport."""
+        tunnels = []
+
+        async def handle(reader, writer):
+            tunnels.append((await reader.readline()).decode().strip())
+            writer.close()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        proxy_env.setenv("HTTPS_PROXY", f"http://127.0.0.1:{port}")
+
+        async with server, create_http_client(timeout=2.0) as client:
+            with pytest.raises(httpx.TransportError):
+                await client.get("https://api.groq.com/openai/v1/models")
+
+        assert tunnels[0] == "CONNECT api.groq.com:443 HTTP/1.1"
+
+    def test_no_proxy_hosts_bypass_proxy(self, proxy_env):
+        """Test that NO_PROXY hosts fall back to the direct transport."""
+        proxy_env.setenv("HTTP_PROXY", "proxy.internal:3128")
+        proxy_env.setenv("NO_PROXY", "localhost,.example.com")
+
+        mounts = _env_proxy_mounts()
+
+        assert isinstance(mounts["http://"], httpx.AsyncHTTPTransport)
+        assert mounts["all://*localhost"] is None
+        assert mounts["all://*.example.com"] is None
+
+    def test_no_proxy_wildcard_disables_proxies(self, proxy_env):
+        """Test that NO_PROXY=* turns proxies off entirely."""
+        proxy_env.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+        proxy_env.setenv("NO_PROXY", "*")
+
+        assert _env_proxy_mounts() == {}
+
+
+class TestGroqSummarizer:
+    """Tests for GroqSummarizer."""
+
+    @pytest.mark.asyncio
+    async def test_summarize_permission_request(self, groq_summarizer, api):
         """Test summarizing a permission request."""
-        httpx_mock.add_response(
+        api.add_response(
             url="https://api.groq.com/openai/v1/chat/completions",
             json={
                 "choices": [{"message": {"content": "Permission requested: Run tests"}}],
@@ -104,134 +302,86 @@ class TestGroqSummarizer:
             summary_type=SummaryType.PERMISSION_REQUEST,
             metadata={"tool_name": "Bash"},
         )
-        result = await summarizer.summarize(request)
+        result = await groq_summarizer.summarize(request)
 
         assert result.text == "Permission requested: Run tests"
         assert result.model_used == "test-model-small"
 
     @pytest.mark.asyncio
-    async def test_summarize_no_api_key(self):
-        """Test that missing API key raises error."""
-        config = SummarizerConfig(groq_api_key=None)
-        summarizer = GroqSummarizer(config)
-
-        request = SummaryRequest(
-            content="Test",
-            summary_type=SummaryType.SHORT_RESPONSE,
+    async def test_summarize_retries_rate_limit(self, groq_summarizer, api):
+        """Test that a 429 response is retried."""
+        api.add_response(
+            url="https://api.groq.com/openai/v1/chat/completions",
+            status_code=429,
         )
-
-        with pytest.raises(ValueError, match="not configured"):
-            await summarizer.summarize(request)
-
-    @pytest.mark.asyncio
-    async def test_health_check_success(self, summarizer, httpx_mock: HTTPXMock):
-        """Test successful health check."""
-        httpx_mock.add_response(
-            url="https://api.groq.com/openai/v1/models",
-            status_code=200,
+        api.add_response(
+            url="https://api.groq.com/openai/v1/chat/completions",
+            json={"choices": [{"message": {"content": "Cleaned text"}}]},
         )
 
-        result = await summarizer.health_check()
-        assert result is True
-
-    @pytest.mark.asyncio
-    async def test_health_check_failure(self, summarizer, httpx_mock: HTTPXMock):
-        """Test failed health check."""
-        httpx_mock.add_response(
-            url="https://api.groq.com/openai/v1/models",
-            status_code=401,
+        request = SummaryRequest(
+            content="Hello world",
+            summary_type=SummaryType.SHORT_RESPONSE,
         )
+        result = await groq_summarizer.summarize(request)
 
-        result = await summarizer.health_check()
-        assert result is False
+        assert result.text == "Cleaned text"
+        assert len(api.requests) == 2
 
     @pytest.mark.asyncio
-    async def test_health_check_no_api_key(self):
-        """Test health check with no API key."""
-        config = SummarizerConfig(groq_api_key=None)
-        summarizer = GroqSummarizer(config)
-
-        result = await summarizer.health_check()
-        assert result is False
-
+    async def test_summarize_rate_limit_exhausted(self, groq_summarizer, api):
+        """Test that the last rate-limited attempt raises instead of returning None."""
+        for _ in range(MAX_ATTEMPTS):
+            api.add_response(
+                url="https://api.groq.com/openai/v1/chat/completions",
+                status_code=429,
+            )
 
-class TestOllamaSummarizer:
-    """Tests for OllamaSummarizer."""
-
-    @pytest.fixture
-    def ollama_config(self):
-        """Create Ollama config."""
-        return SummarizerConfig(
-            backend="ollama",
-            ollama_url="http://localhost:11434",
-            ollama_model_large="qwen3:4b-instruct-2507-q4_K_M",
-            ollama_model_small="qwen3:4b-instruct-2507-q4_K_M",
+        request = SummaryRequest(
+            content="Hello world",
+            summary_type=SummaryType.SHORT_RESPONSE,
         )
+        with pytest.raises(httpx.HTTPStatusError):
+            await groq_summarizer.summarize(request)
 
-    @pytest.fixture
-    def summarizer(self, ollama_config):
-        """Create an OllamaSummarizer instance."""
-        return OllamaSummarizer(ollama_config)
+        assert len(api.requests) == MAX_ATTEMPTS
 
     @pytest.mark.asyncio
-    async def test_summarize_short_response(self, summarizer, httpx_mock: HTTPXMock):
-        """Test summarizing a short response."""
-        httpx_mock.add_response(
-            url="http://localhost:11434/v1/chat/completions",
-            json={
-                "choices": [{"message": {"content": "Cleaned text"}}],
-                "usage": {"total_tokens": 50},
-            },
+    async def test_summarize_error_not_retried(self, groq_summarizer, api):
+        """Test that non-retryable errors are raised immediately."""
+        api.add_response(
+            url="https://api.groq.com/openai/v1/chat/completions",
+            status_code=400,
         )
 
         request = SummaryRequest(
             content="Hello world",
             summary_type=SummaryType.SHORT_RESPONSE,
         )
-        result = await summarizer.summarize(request)
+        with pytest.raises(httpx.HTTPStatusError):
+            await groq_summarizer.summarize(request)
 
-        assert result.text == "Cleaned text"
-        assert result.model_used == "qwen3:4b-instruct-2507-q4_K_M"  # small model for short responses
-        assert result.tokens_used == 50
+        assert len(api.requests) == 1
 
     @pytest.mark.asyncio
-    async def test_summarize_long_response(self, summarizer, httpx_mock: HTTPXMock):
-        """Test summarizing a long response."""
-        httpx_mock.add_response(
-            url="http://localhost:11434/v1/chat/completions",
-            json={
-                "choices": [{"message": {"content": "I updated the files."}}],
-                "usage": {"total_tokens": 100},
-            },
-        )
+    async def test_summarize_no_api_key(self):
+        """Test that missing API key raises error."""
+        config = SummarizerConfig(groq_api_key=None)
+        summarizer = GroqSummarizer(config)
 
         request = SummaryRequest(
-            content="A very long response " * 50,
-            summary_type=SummaryType.LONG_RESPONSE,
-        )
-        result = await summarizer.summarize(request)
-
-        assert result.text == "I updated the files."
-        assert result.model_used == "qwen3:4b-instruct-2507-q4_K_M"  # large model for long responses
-
-    @pytest.mark.asyncio
-    async def test_health_check_success(self, summarizer, httpx_mock: HTTPXMock):
-        """Test successful health check."""
-        httpx_mock.add_response(
-            url="http://localhost:11434/api/tags",
-            status_code=200,
+            content="Test",
+            summary_type=SummaryType.SHORT_RESPONSE,
         )
 
-        result = await summarizer.health_check()
-        assert result is True
+        with pytest.raises(ValueError, match="not configured"):
+            await summarizer.summarize(request)
 
     @pytest.mark.asyncio
-    async def test_health_check_failure(self, summarizer, httpx_mock: HTTPXMock):
-        """Test failed health check."""
-        httpx_mock.add_response(
-            url="http://localhost:11434/api/tags",
-            status_code=500,
-        )
+    async def test_health_check_no_api_key(self):
+        """Test health check with no API key."""
+        config = SummarizerConfig(groq_api_key=None)
+        summarizer = GroqSummarizer(config)
 
         result = await summarizer.health_check()
         assert result is False
@@ -1,17 +1,12 @@
 """Tests for transcript parsing."""
 
-import json
+import io
 
 import pytest
 
 from claude_code_tts_server.core.transcript import parse_transcript
 
 
-def _entries_to_jsonl(entries: list[dict]) -> str:
-    """Convert list of entries to JSONL string."""
-    return "\n".join(json.dumps(entry) for entry in entries)
-
-
 class TestParseTranscript:
     """Tests for parse_transcript function."""
 
@@ -54,6 +49,51 @@ class TestParseTranscript:
         result = parse_transcript("not valid json")
         assert result is None
 
+    def test_parse_entries_matches_jsonl(self, make_transcript):
+        """Test that pre-parsed entries give the same result as their JSONL."""
+        entries = [
+            {"type": "user", "message": {"content": [{"type": "text", "text": "Run it"}]}},
+            {
+                "type": "assistant",
+                "message": {
+                    "content": [
+                        {"type": "text", "text": "Running now."},
+                        {"type": "tool_use", "name": "Bash", "input": {"command": "make"}},
+                    ]
+                }
+            },
+        ]
+
+        result = parse_transcript(iter(entries))
+
+        assert result is not None
+        assert result == parse_transcript(make_transcript(entries))
+
+    def test_parse_file_objects(self, sample_transcript_with_tools):
+        """Test parsing JSONL from text and binary file objects."""
+        expected = parse_transcript(sample_transcript_with_tools)
+
+        assert parse_transcript(io.StringIO(sample_transcript_with_tools)) == expected
+        assert parse_transcript(io.BytesIO(sample_transcript_with_tools.encode())) == expected
+
+    def test_parse_lines_rejected_by_orjson(self):
+        """Test that lone surrogates and NaN still parse, keeping the user boundary."""
+        content = "\n".join([
+            '{"type": "user", "message": {"content": [{"type": "text", "text": "Old"}]}}',
+            '{"type": "assistant", "message": {"content": [{"type": "text", "text": "Old reply"}]}}',
+            '{"type": "user", "message": {"content": [{"type": "text", "text": "New \\ud83d"}]}}',
+            '{"type": "assistant", "message": {"content": [{"type": "text", "text": "New reply"}]}, "cost": NaN}',
+        ])
+
+        result = parse_transcript(content)
+
+        assert result is not None
+        assert result.content == "New reply"
+
+    def test_parse_empty_entries(self):
+        """Test parsing an empty list of entries."""
+        assert parse_transcript([]) is None
+
     def test_parse_transcript_truncates_long_values(self):
         """Test that long tool input values are truncated."""
         long_value = "x" * 200
@@ -76,7 +116,7 @@ class TestParseTranscript:
             },
         ]
 
-        result = parse_transcript(_entries_to_jsonl(entries))
+        result = parse_transcript(entries)
 
         assert result is not None
         assert "..." in result.content
@@ -109,38 +149,13 @@ class TestParseTranscript:
             },
         ]
 
-        result = parse_transcript(_entries_to_jsonl(entries))
+        result = parse_transcript(entries)
 
         assert result is not None
         # Should only include content after the user message (string content)
         assert "New content" in result.content
         assert "Old content" not in result.content
 
-    def test_parse_transcript_truncates_long_content(self):
-        """Test that very long content is truncated."""
-        # Create content that exceeds the default limit
-        long_text = "x" * 25000  # Over 20k default limit
-
-        entries = [
-            {
-                "type": "user",
-                "message": {"content": [{"type": "text", "text": "Start"}]}
-            },
-            {
-                "type": "assistant",
-                "message": {
-                    "content": [{"type": "text", "text": long_text}]
-                }
-            },
-        ]
-
-        result = parse_transcript(_entries_to_jsonl(entries))
-
-        assert result is not None
-        assert result.truncated is True
-        assert "[Earlier content truncated...]" in result.content
-        assert result.length < 25000  # Should be truncated
-
     def test_parse_transcript_truncates_many_messages(self):
         """Test truncation with many assistant messages totaling large content."""
         # Simulate a long conversation with many tool calls (like 338k chars total)
@@ -174,7 +189,7 @@ class TestParseTranscript:
                 }
             })
 
-        result = parse_transcript(_entries_to_jsonl(entries))
+        result = parse_transcript(entries)
 
         assert result is not None
         assert result.truncated is True
@@ -183,28 +198,31 @@ class TestParseTranscript:
         assert result.length <= 20100  # 20k + prefix overhead
         assert result.has_tool_calls is True
 
-    def test_parse_transcript_custom_max_length(self):
-        """Test custom max content length."""
-        entries = [
-            {
-                "type": "user",
-                "message": {"content": [{"type": "text", "text": "Start"}]}
-            },
-            {
-                "type": "assistant",
-                "message": {
-                    "content": [{"type": "text", "text": "A" * 500}]
-                }
-            },
-        ]
-
-        content = _entries_to_jsonl(entries)
-
-        # With default limit, should not truncate
-        result = parse_transcript(content)
-        assert result.truncated is False
+    @pytest.mark.parametrize(
+        "text_length,max_content_length,expect_truncated",
+        [
+            (25000, None, True),  # Over the 20k default limit
+            (500, 100, True),  # Over a custom limit
+            (500, None, False),  # Within the default limit
+        ],
+    )
+    def test_parse_transcript_truncates_content(self, text_length, max_content_length, expect_truncated):
+        """Test that content over the limit is truncated, keeping the most recent text."""
+        # The text is plain ASCII, so the JSONL is built directly instead of via json.dumps
+        content = (
+            '{"type": "user", "message": {"content": [{"type": "text", "text": "Start"}]}}\n'
+            '{"type": "assistant", "message": {"content": [{"type": "text", "text": "'
+            + "x" * text_length
+            + '"}]}}'
+        )
+        kwargs = {"max_content_length": max_content_length} if max_content_length else {}
+
+        result = parse_transcript(content, **kwargs)
 
-        # With small limit, should truncate
-        result = parse_transcript(content, max_content_length=100)
-        assert result.truncated is True
-        assert "[Earlier content truncated...]" in result.content
+        assert result is not None
+        assert result.truncated is expect_truncated
+        assert ("[Earlier content truncated...]" in result.content) is expect_truncated
+        if expect_truncated:
+            assert result.length < text_length
+        else:
+            assert result.length == text_length